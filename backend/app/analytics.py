@@ -0,0 +1,114 @@
+"""
+가격/평점 분석 (컬럼 기반)
+수집한 상품의 수치 필드를 numpy 배열 컬럼으로 모아 벡터 연산으로 분포 통계 계산
+"""
+
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Sequence
+
+import numpy as np
+
+from .compact import ROW_INDEX
+
+COLUMNS = ("price", "originalPrice", "discountRate", "rating", "reviewCount")
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+# 할인 깊이 구간 (%) - [0], [1, 10), [10, 20), [20, 30), [30, 50), [50, 100]
+DISCOUNT_EDGES = (0, 1, 10, 20, 30, 50, 101)
+DISCOUNT_LABELS = ("0", "1-9", "10-19", "20-29", "30-49", "50+")
+
+_row_getter = itemgetter(*COLUMNS)
+_compact_getter = itemgetter(*(ROW_INDEX[name] for name in COLUMNS))
+
+
+def _row(product: Dict) -> tuple:
+    try:
+        return _row_getter(product)
+    except KeyError:
+        return tuple(product.get(name) for name in COLUMNS)
+
+
+class ProductColumns:
+    """상품 수치 필드 컬럼 (없는 값은 NaN)"""
+
+    def __init__(self, matrix: np.ndarray):
+        self.matrix = matrix
+        self.price, self.original_price, self.discount_rate, self.rating, self.review_count = matrix.T
+
+    @classmethod
+    def from_products(cls, products: Sequence[Dict]) -> "ProductColumns":
+        if not products:
+            return cls(np.empty((0, len(COLUMNS)), dtype=np.float64))
+        return cls(np.array([_row(product) for product in products], dtype=np.float64))
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence]) -> "ProductColumns":
+        """압축 행(compact.pack_product)에서 컬럼 생성"""
+        if not rows:
+            return cls(np.empty((0, len(COLUMNS)), dtype=np.float64))
+        return cls(np.array([_compact_getter(row) for row in rows], dtype=np.float64))
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+
+def _summary(values: np.ndarray) -> Optional[Dict[str, Any]]:
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return None
+    percentiles = np.percentile(values, PERCENTILES)
+    return {
+        "count": int(values.size),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "mean": round(float(values.mean()), 2),
+        "percentiles": {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, percentiles)},
+    }
+
+
+def _histogram(values: np.ndarray, bins: int) -> List[Dict[str, Any]]:
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return []
+    counts, edges = np.histogram(values, bins=bins)
+    return [
+        {"from": round(float(edges[i]), 2), "to": round(float(edges[i + 1]), 2), "count": int(counts[i])}
+        for i in range(len(counts))
+    ]
+
+
+def compute_price_stats(columns: ProductColumns, bins: int = 20) -> Dict[str, Any]:
+    """가격 분포, 할인 깊이 구간, 리뷰 수 가중 평점"""
+    total = len(columns)
+    price = columns.price
+    # 가격 0은 파싱 실패값이므로 분포에서 제외
+    valid_price = np.where(price > 0, price, np.nan)
+
+    discount = np.nan_to_num(columns.discount_rate, nan=0.0)
+    discount_counts, _ = np.histogram(np.clip(discount, 0, 100), bins=DISCOUNT_EDGES)
+
+    # 원가 대비 실제 할인율 (원가가 판매가보다 큰 상품만)
+    original = columns.original_price
+    discounted = (original > price) & (price > 0)
+    effective_discount = np.where(discounted, (1 - price / np.where(discounted, original, 1)) * 100, np.nan)
+
+    rating = columns.rating
+    reviews = np.nan_to_num(columns.review_count, nan=0.0)
+    rated = (reviews > 0) & ~np.isnan(rating) & (rating > 0)
+    review_total = float(reviews[rated].sum())
+
+    return {
+        "count": total,
+        "price": _summary(valid_price),
+        "priceHistogram": _histogram(valid_price, bins),
+        "discountBuckets": [
+            {"bucket": label, "count": int(count), "share": round(float(count) / total, 4) if total else 0.0}
+            for label, count in zip(DISCOUNT_LABELS, discount_counts)
+        ],
+        "effectiveDiscount": _summary(effective_discount),
+        "rating": {
+            "mean": round(float(np.nanmean(np.where(rating > 0, rating, np.nan))), 3) if np.any(rating > 0) else None,
+            "reviewWeighted": round(float((rating[rated] * reviews[rated]).sum() / review_total), 3) if review_total else None,
+            "ratedProducts": int(rated.sum()),
+        },
+        "reviewCount": _summary(columns.review_count),
+    }
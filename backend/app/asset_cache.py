@@ -0,0 +1,103 @@
+"""
+브라우저 정적 리소스 디스크 캐시
+요청마다 새 컨텍스트(쿠키/스토리지 격리)를 쓰면 Chromium HTTP 캐시가 비어 있어 매번 JS/CSS 번들을 다시 받으므로,
+컨텍스트 route로 스크립트/스타일시트/폰트를 가로채 모든 페이지가 공유하는 디스크 LRU에서 제공
+쿠키를 설정하거나 쿠키에 따라 달라지는 응답은 저장하지 않음
+"""
+
+import logging
+import os
+import re
+import tempfile
+import time
+from typing import Dict, Optional
+
+from .disk_cache import DiskLRUCache
+
+logger = logging.getLogger(__name__)
+
+BROWSER_ASSET_CACHE = os.environ.get("BROWSER_ASSET_CACHE", "1") != "0"
+BROWSER_ASSET_CACHE_DIR = os.environ.get(
+    "BROWSER_ASSET_CACHE_DIR", os.path.join(tempfile.gettempdir(), "idus-browser-assets")
+)
+BROWSER_ASSET_CACHE_MAX_MB = int(os.environ.get("BROWSER_ASSET_CACHE_MAX_MB", "256"))
+
+# 가로챌 URL (이 외의 요청은 브라우저가 직접 처리하여 route 왕복 비용이 없음)
+ASSET_URL_PATTERN = re.compile(r"^https?://[^?#]+\.(?:js|mjs|css|woff2?)(?:[?#].*)?$")
+ASSET_RESOURCE_TYPES = {"script", "stylesheet", "font"}
+# 재생 시 다시 보내지 않는 헤더 (본문은 이미 디코딩된 상태)
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "date", "age"}
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*(?:s-maxage|max-age)\s*=\s*(\d+)")
+
+
+def cacheable_max_age(headers: Dict[str, str]) -> Optional[int]:
+    """공유 저장이 가능한 응답이면 max-age(초), 아니면 None"""
+    if "set-cookie" in headers or "cookie" in headers.get("vary", "").lower():
+        return None
+    cache_control = headers.get("cache-control", "").lower()
+    if any(token in cache_control for token in ("no-store", "no-cache", "private")):
+        return None
+    match = _MAX_AGE_RE.search(cache_control)
+    if not match or int(match.group(1)) <= 0:
+        return None
+    return int(match.group(1))
+
+
+class BrowserAssetCache:
+    def __init__(self, cache: DiskLRUCache):
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+
+    async def attach(self, context):
+        """컨텍스트의 정적 리소스 요청을 캐시로 처리"""
+        await context.route(ASSET_URL_PATTERN, self._handle)
+
+    async def _handle(self, route):
+        request = route.request
+        if request.method != "GET" or request.resource_type not in ASSET_RESOURCE_TYPES:
+            await route.fallback()
+            return
+
+        entry = self.cache.get(request.url)
+        if entry and entry.meta.get("expires", 0) > time.time():
+            self.hits += 1
+            await route.fulfill(status=entry.meta.get("status", 200), headers=entry.meta.get("headers"), path=entry.path)
+            return
+
+        self.misses += 1
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            logger.warning("Asset fetch error: %s", e, extra={"url": request.url})
+            await route.fallback()
+            return
+
+        max_age = cacheable_max_age(response.headers) if response.status == 200 else None
+        if max_age:
+            headers = {name: value for name, value in response.headers.items() if name not in _DROP_HEADERS}
+            writer = self.cache.writer(request.url, {
+                "status": response.status,
+                "headers": headers,
+                "expires": time.time() + max_age,
+            })
+            # 파일 쓰기는 스레드에서 실행하여 이벤트 루프(다른 페이지 라우트)를 막지 않음
+            try:
+                await writer.awrite(body)
+                if await writer.acommit():
+                    self.stored += 1
+            finally:
+                writer.abort()
+        await route.fulfill(response=response, body=body)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self.cache.stats(), hits=self.hits, misses=self.misses, stored=self.stored)
+
+
+def create_asset_cache() -> Optional[BrowserAssetCache]:
+    if not BROWSER_ASSET_CACHE:
+        return None
+    return BrowserAssetCache(DiskLRUCache(BROWSER_ASSET_CACHE_DIR, BROWSER_ASSET_CACHE_MAX_MB * 1024 * 1024))
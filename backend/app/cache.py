@@ -0,0 +1,61 @@
+"""
+메모리 TTL 캐시
+최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def remaining_ttl(self, key: Hashable) -> Optional[float]:
+        """남은 유효 시간(초), 없거나 만료됐으면 None (히트/미스 집계와 LRU 순서에 영향 없음)"""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        remaining = item[0] - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        item = self._data.pop(key, None)
+        return item[1] if item else None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / total, 3) if total else None,
+        }
@@ -0,0 +1,280 @@
+"""
+검색/상세 결과 공유 캐시
+백엔드는 프로세스 메모리(memory) 또는 Redis 프로토콜(redis) 중 선택
+여러 레플리카가 같은 키를 동시에 가져오지 않도록 짧은 락 키로 single-flight 처리
+"""
+
+import asyncio
+import logging
+import os
+import secrets
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import orjson
+
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory")
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+CACHE_KEY_PREFIX = os.environ.get("CACHE_KEY_PREFIX", "idus:")
+# 가져오는 쪽이 죽어도 락이 남지 않도록 짧게 유지
+SINGLE_FLIGHT_LOCK_TTL = float(os.environ.get("SINGLE_FLIGHT_LOCK_TTL", "30"))
+# 다른 레플리카의 결과를 기다리는 최대 시간과 확인 간격
+SINGLE_FLIGHT_WAIT = float(os.environ.get("SINGLE_FLIGHT_WAIT", "20"))
+SINGLE_FLIGHT_POLL = 0.1
+
+
+class MemoryBackend:
+    """프로세스 메모리 백엔드 (레플리카 간 공유 없음)"""
+
+    def __init__(self, max_entries: int):
+        self._cache = TTLCache(max_entries, ttl=0)
+        self._locks: Dict[str, Tuple[str, float]] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float):
+        self._cache.set(key, value, ttl=ttl)
+
+    async def remaining_ttl(self, key: str) -> Optional[float]:
+        return self._cache.remaining_ttl(key)
+
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        now = time.monotonic()
+        holder = self._locks.get(key)
+        if holder and holder[1] > now:
+            return None
+        token = secrets.token_hex(8)
+        self._locks[key] = (token, now + ttl)
+        return token
+
+    async def is_locked(self, key: str) -> bool:
+        holder = self._locks.get(key)
+        return bool(holder and holder[1] > time.monotonic())
+
+    async def release_lock(self, key: str, token: str):
+        holder = self._locks.get(key)
+        if holder and holder[0] == token:
+            del self._locks[key]
+
+    async def close(self):
+        pass
+
+
+class RedisBackend:
+    """Redis 프로토콜 백엔드 (redis-server, KeyDB, Dragonfly 등), 값은 orjson으로 직렬화"""
+
+    # 락 해제는 자신이 건 락일 때만 (compare-and-delete)
+    _RELEASE_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, url: str, prefix: str = CACHE_KEY_PREFIX, client=None):
+        if client is None:
+            import redis.asyncio as redis
+            client = redis.from_url(url)
+        self._redis = client
+        self._prefix = prefix
+        self._release = self._redis.register_script(self._RELEASE_SCRIPT)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._redis.get(self._prefix + key)
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: float):
+        await self._redis.set(self._prefix + key, orjson.dumps(value), px=max(1, int(ttl * 1000)))
+
+    async def remaining_ttl(self, key: str) -> Optional[float]:
+        remaining = await self._redis.pttl(self._prefix + key)
+        return remaining / 1000 if remaining and remaining > 0 else None
+
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        token = secrets.token_hex(8)
+        acquired = await self._redis.set(self._prefix + key, token, nx=True, px=int(ttl * 1000))
+        return token if acquired else None
+
+    async def is_locked(self, key: str) -> bool:
+        return bool(await self._redis.exists(self._prefix + key))
+
+    async def release_lock(self, key: str, token: str):
+        await self._release(keys=[self._prefix + key], args=[token])
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+def create_backend(max_entries: int):
+    if CACHE_BACKEND == "redis":
+        logger.info("Using Redis cache backend", extra={"redis": REDIS_URL.split("@")[-1]})
+        return RedisBackend(REDIS_URL)
+    return MemoryBackend(max_entries)
+
+
+class SharedCache:
+    """백엔드 위의 결과 캐시 - 프로세스 내 요청 합치기 + 레플리카 간 락 기반 single-flight"""
+
+    def __init__(self, backend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        # 키 -> (진행 중인 fetch 결과, 백그라운드 fetch 여부)
+        self._inflight: Dict[str, Tuple[asyncio.Future, bool]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.remote_waits = 0
+        # cacheable 검사에 걸려 저장하지 않은 결과 수
+        self.uncached = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            logger.warning("Cache get error: %s", e)
+            return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        try:
+            await self.backend.set(key, value, self.ttl if ttl is None else ttl)
+        except Exception as e:
+            logger.warning("Cache set error: %s", e)
+
+    async def remaining_ttl(self, key: str) -> Optional[float]:
+        try:
+            return await self.backend.remaining_ttl(key)
+        except Exception as e:
+            logger.warning("Cache ttl error: %s", e)
+            return None
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        refresh: bool = False,
+        background: bool = False,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        캐시 값 반환, 없으면 fetch 실행 후 저장 (값, 캐시 히트 여부)
+        refresh면 기존 값을 무시하고 다시 가져옴 (캐시 워밍용)
+        background: 대체 경로 없이 실행되는 fetch (워밍/선행 수집) - 실패하면 합류한 사용자 요청은 직접 다시 가져옴
+        cacheable: False를 반환하는 결과(실패 기본값, 빈 결과 등)는 반환만 하고 저장하지 않음
+        """
+        if not refresh:
+            value = await self.get(key)
+            if value is not None:
+                self.hits += 1
+                return value, True
+
+        # 같은 프로세스에서 이미 가져오는 중이면 그 결과를 기다림
+        while key in self._inflight:
+            inflight, inflight_background = self._inflight[key]
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight), True
+            except BaseException:
+                # 자신이 취소된 경우(합류한 fetch는 아직 진행 중)나 사용자 fetch 실패는 그대로 전달
+                if background or not inflight_background or not inflight.done():
+                    raise
+                # 백그라운드 fetch는 브라우저 대체가 없으므로 실패/취소돼도 사용자 요청은 직접 가져옴
+                self.coalesced -= 1
+
+        future = asyncio.get_running_loop().create_future()
+        # 기다리는 쪽이 없을 때 예외 미확인 경고 방지
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = (future, background)
+        try:
+            value, hit = await self._fetch_single_flight(key, fetch, ttl, refresh, cacheable)
+            future.set_result(value)
+            return value, hit
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fetch_single_flight(self, key, fetch, ttl, refresh, cacheable) -> Tuple[Any, bool]:
+        lock_key = f"lock:{key}"
+        try:
+            token = await self.backend.acquire_lock(lock_key, SINGLE_FLIGHT_LOCK_TTL)
+        except Exception as e:
+            logger.warning("Cache lock error: %s", e)
+            token = ""
+
+        if token is None:
+            # 다른 레플리카가 가져오는 중 - 끝날 때까지 대기, 시간이 지나면 직접 가져옴
+            self.remote_waits += 1
+            deadline = time.monotonic() + SINGLE_FLIGHT_WAIT
+            while token is None:
+                value = await self._wait_for_holder(key, lock_key, deadline, refresh)
+                if value is not None:
+                    self.hits += 1
+                    return value, True
+                if time.monotonic() >= deadline:
+                    logger.warning("Single-flight wait timed out", extra={"key": key})
+                    token = ""
+                    break
+                # 값을 저장하지 못하고 락이 풀림 (가져오기 실패) - 직접 락을 잡고 가져옴
+                try:
+                    token = await self.backend.acquire_lock(lock_key, SINGLE_FLIGHT_LOCK_TTL)
+                except Exception as e:
+                    logger.warning("Cache lock error: %s", e)
+                    token = ""
+
+        self.misses += 1
+        try:
+            value = await fetch()
+            if cacheable is None or cacheable(value):
+                await self.set(key, value, ttl)
+            else:
+                self.uncached += 1
+            return value, False
+        finally:
+            if token:
+                try:
+                    await self.backend.release_lock(lock_key, token)
+                except Exception as e:
+                    logger.warning("Cache unlock error: %s", e)
+
+    async def _wait_for_holder(self, key: str, lock_key: str, deadline: float, refresh: bool) -> Optional[Any]:
+        """
+        락을 가진 레플리카의 결과 대기 - 락이 풀리면 저장된 값(없으면 None) 반환
+        refresh면 기존 값은 갱신 전 값이므로 락이 풀린 뒤에만 읽음
+        """
+        while time.monotonic() < deadline:
+            await asyncio.sleep(SINGLE_FLIGHT_POLL)
+            if not refresh:
+                value = await self.get(key)
+                if value is not None:
+                    return value
+            try:
+                locked = await self.backend.is_locked(lock_key)
+            except Exception as e:
+                logger.warning("Cache lock error: %s", e)
+                return None
+            if not locked:
+                return await self.get(key)
+        return None
+
+    async def close(self):
+        await self.backend.close()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "remoteWaits": self.remote_waits,
+            "uncached": self.uncached,
+            "hitRate": round(self.hits / total, 3) if total else None,
+        }
@@ -0,0 +1,117 @@
+"""
+상품 가격/리뷰 변경 피드
+정규화된 상품을 마지막 스냅샷과 비교하여 달라진 필드만 append-only 로그에 기록
+값이 없는(None) 필드는 비교하지 않고, 스냅샷은 최근 본 상품만 LRU로 유지
+"""
+
+import bisect
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, List, Any, Tuple
+
+# 추적 대상 필드 (로그에는 이름 대신 인덱스로 저장)
+TRACKED_FIELDS = ("price", "originalPrice", "discountRate", "rating", "reviewCount")
+CHANGE_LOG_MAX_ENTRIES = int(os.environ.get("CHANGE_LOG_MAX_ENTRIES", "200000"))
+CHANGE_SNAPSHOT_MAX_PRODUCTS = int(os.environ.get("CHANGE_SNAPSHOT_MAX_PRODUCTS", "100000"))
+
+
+class ChangeFeed:
+    def __init__(self, max_entries: int = CHANGE_LOG_MAX_ENTRIES, max_products: int = CHANGE_SNAPSHOT_MAX_PRODUCTS):
+        self.max_entries = max_entries
+        self.max_products = max_products
+        # 상품 ID -> 추적 필드 값 튜플 (오래 보지 못한 상품부터 제거)
+        self._snapshots: "OrderedDict[str, Tuple]" = OrderedDict()
+        # 키워드는 인덱스로 저장
+        self._keywords: List[str] = []
+        self._keyword_ids: Dict[str, int] = {}
+        # 로그: 시각 배열(이분 탐색용)과 (키워드 인덱스, 상품 ID, ((필드 인덱스, 이전 값, 새 값), ...)) 배열
+        self._times: List[float] = []
+        self._entries: List[Tuple[int, str, Tuple]] = []
+
+    def _keyword_id(self, keyword: str) -> int:
+        keyword_id = self._keyword_ids.get(keyword)
+        if keyword_id is None:
+            keyword_id = len(self._keywords)
+            self._keywords.append(keyword)
+            self._keyword_ids[keyword] = keyword_id
+        return keyword_id
+
+    def observe(self, keyword: str, products: List[Dict]) -> int:
+        """상품 목록을 스냅샷과 비교하여 변경분 기록, 기록된 상품 수 반환 (처음 본 상품은 기준값만 저장)"""
+        keyword_id = None
+        recorded = 0
+        for product in products:
+            product_id = product.get("id")
+            if not product_id:
+                continue
+            values = tuple(product.get(name) for name in TRACKED_FIELDS)
+            previous = self._snapshots.get(product_id)
+            if previous is not None:
+                # 이번 결과에 없는 값은 이전 값 유지 (경로에 따라 일부 필드가 None)
+                values = tuple(old if new is None else new for old, new in zip(previous, values))
+                self._snapshots.move_to_end(product_id)
+            self._snapshots[product_id] = values
+            if previous is None:
+                if len(self._snapshots) > self.max_products:
+                    self._snapshots.popitem(last=False)
+                continue
+
+            deltas = tuple(
+                (index, old, new)
+                for index, (old, new) in enumerate(zip(previous, values))
+                if old != new and old is not None
+            )
+            if not deltas:
+                continue
+            if keyword_id is None:
+                keyword_id = self._keyword_id(keyword.strip())
+            self._append(keyword_id, product_id, deltas)
+            recorded += 1
+        return recorded
+
+    def _append(self, keyword_id: int, product_id: str, deltas: Tuple):
+        # 같은 시각에 여러 건이 들어와도 since 비교가 정확하도록 시각을 단조 증가시킴
+        now = time.time()
+        if self._times and now <= self._times[-1]:
+            now = self._times[-1] + 1e-6
+        self._times.append(now)
+        self._entries.append((keyword_id, product_id, deltas))
+
+        if len(self._entries) > self.max_entries:
+            # 오래된 절반을 한 번에 잘라 매 호출마다 리스트를 옮기지 않도록 함
+            cut = len(self._entries) - self.max_entries // 2
+            del self._times[:cut]
+            del self._entries[:cut]
+
+    def since(self, since: float, keyword: Optional[str] = None, limit: int = 1000) -> Dict[str, Any]:
+        """since(epoch 초) 이후 변경분 반환, 다음 폴링은 응답의 until 값을 since로 사용"""
+        keyword_id = self._keyword_ids.get(keyword.strip()) if keyword else None
+        if keyword and keyword_id is None:
+            return {"changes": [], "until": since, "hasMore": False}
+
+        start = bisect.bisect_right(self._times, since)
+        changes = []
+        until = since
+        has_more = False
+        for position in range(start, len(self._entries)):
+            entry_keyword_id, product_id, deltas = self._entries[position]
+            if keyword_id is not None and entry_keyword_id != keyword_id:
+                continue
+            if len(changes) >= limit:
+                has_more = True
+                break
+            until = self._times[position]
+            changes.append({
+                "id": product_id,
+                "keyword": self._keywords[entry_keyword_id],
+                "at": until,
+                "fields": {TRACKED_FIELDS[index]: [old, new] for index, old, new in deltas},
+            })
+
+        if not has_more and self._times:
+            until = max(until, self._times[-1])
+        return {"changes": changes, "until": until, "hasMore": has_more}
+
+    def stats(self) -> Dict[str, int]:
+        return {"products": len(self._snapshots), "entries": len(self._entries)}
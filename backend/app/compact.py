@@ -0,0 +1,105 @@
+"""
+캐시/저장소용 상품 압축 표현
+상품 dict 대신 고정 순서 튜플 행으로 보관 - 작가명/카테고리/URL 접두사는 intern하여 상품 간 공유하고,
+상품 URL이 접두사 + 상품 ID면 접두사만 저장, 응답 직전에만 기존 JSON 형태의 dict로 복원
+"""
+
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 응답 필드 (기존 JSON 형태, 순서 유지)
+PRODUCT_FIELDS = (
+    "id", "title", "price", "originalPrice", "discountRate", "image",
+    "artistName", "rating", "reviewCount", "url", "category",
+)
+
+# 행 인덱스 - 이미지/상품 URL은 (intern된 접두사, 나머지) 두 칸, 상품 URL 나머지가 상품 ID와 같으면 None
+(ID, TITLE, PRICE, ORIGINAL_PRICE, DISCOUNT_RATE, IMAGE_PREFIX, IMAGE_NAME,
+ ARTIST_NAME, RATING, REVIEW_COUNT, URL_PREFIX, URL_TAIL, CATEGORY) = range(13)
+
+# 단일 칸에 저장되는 필드의 행 인덱스
+ROW_INDEX = {
+    "id": ID,
+    "title": TITLE,
+    "price": PRICE,
+    "originalPrice": ORIGINAL_PRICE,
+    "discountRate": DISCOUNT_RATE,
+    "artistName": ARTIST_NAME,
+    "rating": RATING,
+    "reviewCount": REVIEW_COUNT,
+    "category": CATEGORY,
+}
+
+ProductRow = Tuple
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _split_url(url: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """마지막 / 까지를 intern된 접두사로 분리"""
+    if not url:
+        return None, url
+    cut = url.rfind("/") + 1
+    if cut == 0:
+        return None, url
+    return sys.intern(url[:cut]), url[cut:]
+
+
+def pack_product(product: Dict) -> ProductRow:
+    product_id = product.get("id")
+    image_prefix, image_name = _split_url(product.get("image"))
+    url_prefix, url_tail = _split_url(product.get("url"))
+    if url_prefix is not None and url_tail == product_id:
+        url_tail = None
+    return (
+        product_id,
+        product.get("title"),
+        product.get("price"),
+        product.get("originalPrice"),
+        product.get("discountRate"),
+        image_prefix,
+        image_name,
+        _intern(product.get("artistName")),
+        product.get("rating"),
+        product.get("reviewCount"),
+        url_prefix,
+        url_tail,
+        _intern(product.get("category")),
+    )
+
+
+def pack_products(products: Iterable[Dict]) -> List[ProductRow]:
+    return [pack_product(product) for product in products]
+
+
+def product_url(row: Sequence) -> Optional[str]:
+    url_prefix, url_tail = row[URL_PREFIX], row[URL_TAIL]
+    if url_prefix is not None and url_tail is None:
+        return url_prefix + row[ID]
+    return (url_prefix or "") + url_tail if url_tail is not None else url_prefix
+
+
+def unpack_product(row: Sequence, fields: Optional[Tuple[str, ...]] = None) -> Dict:
+    """행을 응답 dict로 복원 (fields가 있으면 해당 필드만, Redis에서 읽은 리스트 행도 처리)"""
+    product = {
+        "id": row[ID],
+        "title": row[TITLE],
+        "price": row[PRICE],
+        "originalPrice": row[ORIGINAL_PRICE],
+        "discountRate": row[DISCOUNT_RATE],
+        "image": (row[IMAGE_PREFIX] or "") + row[IMAGE_NAME] if row[IMAGE_NAME] is not None else row[IMAGE_PREFIX],
+        "artistName": row[ARTIST_NAME],
+        "rating": row[RATING],
+        "reviewCount": row[REVIEW_COUNT],
+        "url": product_url(row),
+        "category": row[CATEGORY],
+    }
+    if fields is None:
+        return product
+    return {name: product.get(name) for name in fields}
+
+
+def unpack_products(rows: Iterable[Sequence], fields: Optional[Tuple[str, ...]] = None) -> List[Dict]:
+    return [unpack_product(row, fields) for row in rows]
@@ -0,0 +1,180 @@
+"""
+용량 제한 디스크 LRU 캐시
+본문은 <hash>.bin, 메타데이터(content-type, etag 등)는 <hash>.json 으로 저장
+재시작 시 디렉토리를 스캔하여 인덱스를 복구 (파일 mtime을 최근 사용 시각으로 사용)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any
+
+
+@dataclass
+class DiskCacheEntry:
+    path: str
+    size: int
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+class DiskCacheWriter:
+    """
+    임시 파일에 청크를 쓰고 commit 시 캐시에 등록
+    이벤트 루프에서는 awrite/acommit 사용 (파일 I/O는 스레드에서, 인덱스 갱신은 루프에서)
+    """
+
+    def __init__(self, cache: "DiskLRUCache", key: str, meta: Dict[str, Any]):
+        self._cache = cache
+        self._key = key
+        self._meta = meta
+        self._name = cache._file_name(key)
+        self._tmp_path = os.path.join(cache.directory, f"{self._name}.{os.getpid()}.{time.monotonic_ns()}.tmp")
+        self._file = None
+        self._size = 0
+        self._done = False
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self._tmp_path, "wb")
+
+    def write(self, chunk: bytes):
+        if self._done:
+            return
+        self._open()
+        self._file.write(chunk)
+        self._size += len(chunk)
+        if self._size > self._cache.max_bytes:
+            # 캐시 전체보다 큰 파일은 저장하지 않음
+            self.abort()
+
+    def _store(self):
+        self._open()
+        self._file.close()
+        self._cache._store_files(self._key, self._name, self._tmp_path, self._meta)
+
+    def commit(self) -> Optional[DiskCacheEntry]:
+        if self._done:
+            return None
+        self._done = True
+        self._store()
+        return self._cache._register(self._key, self._name, self._size, self._meta)
+
+    def abort(self):
+        if self._done:
+            return
+        self._done = True
+        if self._file is None:
+            return
+        self._file.close()
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+    async def awrite(self, chunk: bytes):
+        if not self._done:
+            await asyncio.to_thread(self.write, chunk)
+
+    async def acommit(self) -> Optional[DiskCacheEntry]:
+        if self._done:
+            return None
+        self._done = True
+        await asyncio.to_thread(self._store)
+        return self._cache._register(self._key, self._name, self._size, self._meta)
+
+
+class DiskLRUCache:
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[str, DiskCacheEntry]" = OrderedDict()
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _file_name(self, key: str) -> str:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _load(self):
+        """디렉토리 스캔으로 인덱스 복구 (오래 사용하지 않은 순)"""
+        found = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(".tmp"):
+                # 비정상 종료로 남은 임시 파일
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    meta = json.load(f)
+                body_path = path[:-5] + ".bin"
+                stat = os.stat(body_path)
+            except (OSError, ValueError):
+                continue
+            found.append((stat.st_mtime, meta.get("key"), DiskCacheEntry(body_path, stat.st_size, meta)))
+
+        for _, key, entry in sorted(found, key=lambda item: item[0]):
+            if key:
+                self._entries[key] = entry
+                self.total_bytes += entry.size
+        self._evict()
+
+    def get(self, key: str) -> Optional[DiskCacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not os.path.exists(entry.path):
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        try:
+            os.utime(entry.path)
+        except OSError:
+            pass
+        return entry
+
+    def writer(self, key: str, meta: Dict[str, Any]) -> DiskCacheWriter:
+        return DiskCacheWriter(self, key, meta)
+
+    def _store_files(self, key: str, name: str, tmp_path: str, meta: Dict[str, Any]):
+        """임시 파일을 본문 파일로 옮기고 메타데이터 기록 (인덱스는 건드리지 않아 스레드에서 실행 가능)"""
+        os.replace(tmp_path, os.path.join(self.directory, f"{name}.bin"))
+        with open(os.path.join(self.directory, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(dict(meta, key=key), f)
+
+    def _register(self, key: str, name: str, size: int, meta: Dict[str, Any]) -> DiskCacheEntry:
+        if key in self._entries:
+            self.total_bytes -= self._entries.pop(key).size
+        entry = DiskCacheEntry(os.path.join(self.directory, f"{name}.bin"), size, meta)
+        self._entries[key] = entry
+        self.total_bytes += size
+        self._evict()
+        return entry
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.total_bytes -= entry.size
+        for path in (entry.path, entry.path[:-4] + ".json"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "bytes": self.total_bytes, "maxBytes": self.max_bytes}
@@ -0,0 +1,95 @@
+"""
+상품 식별자 정규화
+같은 상품이 경로에 따라 다른 URL로 보이므로 (API 검색: /v2/product/{id}, HTML 검색: /w/product/{id} 또는 item url)
+URL/ID 변형을 하나의 키로 맞춰 상세 수집, 캐시, 배치 작업이 상품당 한 번만 처리하도록 함
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Sequence
+from urllib.parse import unquote, urlparse
+
+from .compact import ID, product_url
+from .scraper import IDUS_BASE_URL
+
+# 상품 상세 경로 (쿼리/프래그먼트/끝 슬래시 무시) - idus 호스트의 경로 전체와 일치해야 함
+_PRODUCT_PATH_RE = re.compile(r"^/(?:v2/|w/)?product/([^/]+)/?$")
+PRODUCT_HOSTS = {
+    "www.idus.com",
+    "idus.com",
+    urlparse(IDUS_BASE_URL).netloc,
+}
+# 경로로 ID를 알 수 없는 URL -> 키 / 키워드 간 중복 집계용 최근 상품 키 최대 개수
+IDENTITY_MAX_ALIASES = 50000
+IDENTITY_MAX_TRACKED = 50000
+
+
+def product_key(value: Optional[str]) -> Optional[str]:
+    """
+    상품 URL 또는 ID를 정규 키로 변환
+    idus 호스트의 상품 경로가 아닌 URL이면 None (다른 호스트 응답이 상품 키로 캐시되지 않도록)
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if "/" not in value:
+        return value.lower() or None
+    parsed = urlparse(value)
+    if parsed.scheme not in ("http", "https") or parsed.netloc not in PRODUCT_HOSTS:
+        return None
+    match = _PRODUCT_PATH_RE.match(parsed.path)
+    if not match:
+        return None
+    return unquote(match.group(1)).lower()
+
+
+class ProductIdentityIndex:
+    """검색 결과에서 본 상품 URL을 키로 연결하고, 여러 키워드에 걸친 중복 상품 수를 집계"""
+
+    def __init__(self, max_aliases: int = IDENTITY_MAX_ALIASES, max_tracked: int = IDENTITY_MAX_TRACKED):
+        self.max_aliases = max_aliases
+        self.max_tracked = max_tracked
+        self._aliases: "OrderedDict[str, str]" = OrderedDict()
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self.observed = 0
+        self.duplicates = 0
+
+    def observe(self, rows: Iterable[Sequence]):
+        """새로 수집한 검색 결과 행 기록 (압축 행)"""
+        for row in rows:
+            key = product_key(row[ID])
+            if key is None:
+                continue
+            url = product_url(row)
+            if url and product_key(url) != key:
+                self._aliases[url.strip()] = key
+                self._aliases.move_to_end(url.strip())
+                if len(self._aliases) > self.max_aliases:
+                    self._aliases.popitem(last=False)
+
+            self.observed += 1
+            if key in self._seen:
+                self.duplicates += 1
+                self._seen.move_to_end(key)
+            else:
+                self._seen[key] = None
+                if len(self._seen) > self.max_tracked:
+                    self._seen.popitem(last=False)
+
+    def resolve(self, value: str) -> str:
+        """상품 URL/ID의 정규 키 (모르는 형태의 URL은 검색 결과에서 본 적이 없으면 URL 그대로)"""
+        key = product_key(value)
+        if key is not None:
+            return key
+        value = value.strip()
+        return self._aliases.get(value, value)
+
+    def stats(self) -> Dict:
+        return {
+            "aliases": len(self._aliases),
+            "tracked": len(self._seen),
+            "observed": self.observed,
+            "duplicates": self.duplicates,
+            # 새로 수집한 검색 결과 상품 중 이미 본 상품 비율 (다른 키워드/페이지와 겹치거나 재수집)
+            "duplicateRatio": round(self.duplicates / self.observed, 3) if self.observed else None,
+        }
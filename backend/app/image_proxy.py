@@ -0,0 +1,143 @@
+"""
+idus 이미지 프록시
+요청 폭에 맞는 가장 작은 idus 사이즈 변형을 받아 디스크 LRU에 저장하고, 메모리에 모으지 않고 스트리밍으로 응답
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+from fastapi import HTTPException
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from .disk_cache import DiskLRUCache
+from .scraper import IDUS_BASE_URL, IDUS_IMAGE_BASE_URL
+
+logger = logging.getLogger(__name__)
+
+IMAGE_CACHE_DIR = os.environ.get("IMAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "idus-image-cache"))
+IMAGE_CACHE_MAX_MB = int(os.environ.get("IMAGE_CACHE_MAX_MB", "512"))
+
+# idus 이미지 서버의 가로 폭 변형 ({id}_{width}.jpg)
+IDUS_IMAGE_WIDTHS = (100, 200, 320, 400, 640, 720, 1000)
+# 파일 ID가 같으면 내용이 바뀌지 않으므로 길게 캐시
+CACHE_CONTROL = "public, max-age=604800, immutable"
+CHUNK_SIZE = 65536
+
+_VARIANT_RE = re.compile(r"^(?P<prefix>.+/image/files/[^/]+?)_(?P<width>\d+)(?P<ext>\.\w+)$")
+
+ALLOWED_HOSTS = {
+    "image.idus.com",
+    "www.idus.com",
+    urlparse(IDUS_BASE_URL).netloc,
+    urlparse(IDUS_IMAGE_BASE_URL).netloc,
+}
+
+
+def pick_variant_url(url: str, width: Optional[int]) -> str:
+    """요청 폭 이상인 가장 작은 변형으로 URL 변경 (변형 형식이 아니거나 width가 없으면 그대로)"""
+    if not width:
+        return url
+    match = _VARIANT_RE.match(url)
+    if not match:
+        return url
+    fitting = [w for w in IDUS_IMAGE_WIDTHS if w >= width]
+    target = fitting[0] if fitting else IDUS_IMAGE_WIDTHS[-1]
+    return f"{match.group('prefix')}_{target}{match.group('ext')}"
+
+
+class UpstreamStreamingResponse(StreamingResponse):
+    """스트리밍을 시작하기 전에 클라이언트가 끊겨도 업스트림 연결을 풀에 반환"""
+
+    def __init__(self, content, upstream: aiohttp.ClientResponse, **kwargs):
+        super().__init__(content, **kwargs)
+        self.upstream = upstream
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.upstream.release()
+
+
+def make_etag(key: str) -> str:
+    return '"' + hashlib.sha1(key.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+class ImageProxy:
+    def __init__(self, get_session: Callable[[], Awaitable[aiohttp.ClientSession]], cache: DiskLRUCache):
+        self._get_session = get_session
+        self.cache = cache
+
+    async def respond(self, url: str, width: Optional[int], if_none_match: Optional[str]) -> Response:
+        if url.startswith("//"):
+            url = "https:" + url
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or parsed.netloc not in ALLOWED_HOSTS:
+            raise HTTPException(status_code=400, detail="허용되지 않은 이미지 주소입니다")
+
+        key = pick_variant_url(url, width)
+        etag = make_etag(key)
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+        # 같은 키의 이미지는 변하지 않으므로 ETag가 같으면 디스크를 보지 않고 304
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        entry = self.cache.get(key)
+        if entry:
+            return FileResponse(
+                entry.path,
+                media_type=entry.meta.get("contentType", "image/jpeg"),
+                headers=dict(headers, **{"X-Cache": "HIT"}),
+            )
+
+        upstream = await self._fetch(key)
+        if upstream is None and key != url:
+            # 해당 폭 변형이 없으면 원본 URL로 재시도
+            upstream = await self._fetch(url)
+        if upstream is None:
+            raise HTTPException(status_code=502, detail="이미지를 가져올 수 없습니다")
+
+        content_type = upstream.headers.get("Content-Type", "image/jpeg")
+        if upstream.content_length is not None:
+            headers["Content-Length"] = str(upstream.content_length)
+        headers["X-Cache"] = "MISS"
+
+        return UpstreamStreamingResponse(
+            self._stream(key, upstream, content_type), upstream, media_type=content_type, headers=headers
+        )
+
+    async def _fetch(self, url: str) -> Optional[aiohttp.ClientResponse]:
+        session = await self._get_session()
+        try:
+            # 리다이렉트를 따라가면 허용 호스트 검사를 우회할 수 있으므로 따라가지 않음
+            response = await session.get(url, timeout=aiohttp.ClientTimeout(total=15), allow_redirects=False)
+        except (aiohttp.ClientError, TimeoutError) as e:
+            logger.warning("Image fetch error: %s", e, extra={"url": url})
+            return None
+        if response.status != 200 or not response.headers.get("Content-Type", "").startswith("image/"):
+            logger.warning("Image fetch failed", extra={"status": response.status, "url": url})
+            response.release()
+            return None
+        return response
+
+    async def _stream(self, key: str, upstream: aiohttp.ClientResponse, content_type: str):
+        """
+        업스트림 청크를 그대로 전달하면서 캐시 파일에 기록 (끝까지 받은 경우에만 캐시 등록)
+        파일 쓰기는 스레드에서 실행하여 이벤트 루프를 막지 않음
+        """
+        writer = self.cache.writer(key, {"contentType": content_type})
+        try:
+            async for chunk in upstream.content.iter_chunked(CHUNK_SIZE):
+                await writer.awrite(chunk)
+                yield chunk
+            await writer.acommit()
+        finally:
+            writer.abort()
+            upstream.release()
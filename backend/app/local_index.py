@@ -0,0 +1,146 @@
+"""
+로컬 상품 전문 검색 인덱스
+검색으로 정규화된 상품의 제목/작가명/카테고리를 글자 bigram/trigram으로 역색인 (한글 띄어쓰기 변형에 강함)
+한 글자 검색어(컵, 꽃, 펜)도 찾을 수 있도록 한글 음절 unigram을 낮은 가중치로 함께 색인
+"""
+
+import heapq
+import math
+import os
+import re
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Any
+
+from .compact import ROW_INDEX, ProductRow, pack_product, unpack_product
+
+LOCAL_INDEX_MAX_PRODUCTS = int(os.environ.get("LOCAL_INDEX_MAX_PRODUCTS", "50000"))
+
+# 필드별 가중치
+FIELD_WEIGHTS = (("title", 1.0), ("artistName", 0.6), ("category", 0.4))
+_TEXT_COLUMNS = tuple(ROW_INDEX[name] for name, _ in FIELD_WEIGHTS)
+# 한글 음절 unigram 가중치 (필드 가중치에 곱함)
+UNIGRAM_WEIGHT = 0.3
+# 쿼리 n-gram 중 이 비율 이상이 맞아야 결과에 포함
+MIN_QUERY_COVERAGE = 0.5
+
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣ㄱ-ㆎ]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def tokenize(text: str) -> List[str]:
+    """정규화 후 단어별 글자 bigram/trigram (2글자 이하 단어는 그대로)"""
+    if not text:
+        return []
+    text = unicodedata.normalize("NFKC", text).lower()
+    grams = []
+    for word in _TOKEN_RE.findall(text):
+        if len(word) <= 2:
+            grams.append(word)
+            continue
+        grams.extend(word[i:i + 2] for i in range(len(word) - 1))
+        grams.extend(word[i:i + 3] for i in range(len(word) - 2))
+    return grams
+
+
+def hangul_unigrams(text: str) -> List[str]:
+    """2글자 이상 단어의 한글 음절 (1글자 단어는 tokenize에서 그대로 색인)"""
+    if not text:
+        return []
+    text = unicodedata.normalize("NFKC", text).lower()
+    return [char for word in _TOKEN_RE.findall(text) if len(word) > 1 for char in _HANGUL_RE.findall(word)]
+
+
+def _row_texts(row: ProductRow) -> tuple:
+    return tuple(row[column] or "" for column in _TEXT_COLUMNS)
+
+
+def _term_weights(texts: tuple) -> Dict[str, float]:
+    """필드 텍스트 -> n-gram별 가중치 (여러 필드에 나오면 가장 큰 가중치)"""
+    weights: Dict[str, float] = {}
+    for (name, field_weight), text in zip(FIELD_WEIGHTS, texts):
+        for gram in tokenize(text):
+            weights[gram] = max(weights.get(gram, 0.0), field_weight)
+        for gram in hangul_unigrams(text):
+            weights[gram] = max(weights.get(gram, 0.0), field_weight * UNIGRAM_WEIGHT)
+    return weights
+
+
+class LocalProductIndex:
+    def __init__(self, max_products: int = LOCAL_INDEX_MAX_PRODUCTS):
+        self.max_products = max_products
+        # 상품 ID -> 압축 행 (삽입 순서로 오래된 상품부터 제거)
+        self._products: "OrderedDict[str, ProductRow]" = OrderedDict()
+        # n-gram -> {상품 ID: 가중치} (상품별 n-gram 목록은 따로 두지 않고 제거 시 저장된 행에서 다시 계산)
+        self._postings: Dict[str, Dict[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def add_products(self, products: List[Dict]) -> int:
+        """상품 추가/갱신 (텍스트가 바뀐 경우에만 재색인), 새로 색인된 상품 수 반환"""
+        indexed = 0
+        for product in products:
+            product_id = product.get("id")
+            if not product_id:
+                continue
+            row = pack_product(product)
+            texts = _row_texts(row)
+            previous = self._products.get(product_id)
+            self._products[product_id] = row
+            self._products.move_to_end(product_id)
+            if previous:
+                previous_texts = _row_texts(previous)
+                if previous_texts == texts:
+                    continue
+                self._unindex(product_id, previous_texts)
+
+            for gram, weight in _term_weights(texts).items():
+                self._postings.setdefault(gram, {})[product_id] = weight
+            indexed += 1
+
+        while len(self._products) > self.max_products:
+            oldest, row = self._products.popitem(last=False)
+            self._unindex(oldest, _row_texts(row))
+        return indexed
+
+    def _unindex(self, product_id: str, texts: tuple):
+        """색인할 때 쓴 텍스트로 n-gram을 다시 계산해 역색인에서 제거"""
+        for gram in _term_weights(texts):
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.pop(product_id, None)
+            if not posting:
+                del self._postings[gram]
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """n-gram 일치 점수(idf × 필드 가중치) 순으로 상품 반환"""
+        grams = set(tokenize(query))
+        if not grams or not self._products:
+            return []
+
+        total = len(self._products)
+        scores: Dict[str, float] = {}
+        matched: Dict[str, int] = {}
+        max_score = 0.0
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                continue
+            idf = math.log(1 + total / len(posting))
+            max_score += idf
+            for product_id, weight in posting.items():
+                scores[product_id] = scores.get(product_id, 0.0) + idf * weight
+                matched[product_id] = matched.get(product_id, 0) + 1
+
+        min_matched = max(1, math.ceil(len(grams) * MIN_QUERY_COVERAGE))
+        candidates = ((score, product_id) for product_id, score in scores.items() if matched[product_id] >= min_matched)
+        top = heapq.nlargest(limit, candidates)
+        return [
+            dict(unpack_product(self._products[product_id]), score=round(score / max_score, 4) if max_score else 0.0)
+            for score, product_id in top
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        return {"products": len(self._products), "grams": len(self._postings)}
@@ -0,0 +1,152 @@
+"""
+구조화 로깅
+이벤트 루프에서는 레코드를 큐에 넣기만 하고, 포맷/출력은 QueueListener 스레드에서 처리
+요청별 상관 ID(X-Request-ID)를 contextvar로 모든 로그에 붙이고, 대량 디버그 로그는 샘플링
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+import orjson
+
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+# json (Railway 로그 수집용) 또는 text (로컬 개발용)
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "json")
+# debug_sampled로 남긴 로그 중 실제로 출력할 비율
+LOG_SAMPLE_RATE = float(os.environ.get("LOG_SAMPLE_RATE", "0.05"))
+
+# app 패키지 로거 (모듈은 logging.getLogger(__name__) 사용)
+APP_LOGGER = __name__.rpartition(".")[0] or "app"
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+_STANDARD_ATTRS = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime", "request_id"}
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class ContextFilter(logging.Filter):
+    """호출한 태스크의 상관 ID를 레코드에 기록 (큐에 넣기 전에 실행되어야 함)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["requestId"] = record.request_id
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+class _EnqueueHandler(logging.handlers.QueueHandler):
+    """메시지 인자만 합쳐서 큐에 넣음 (JSON 직렬화/예외 포맷은 리스너 스레드에서)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def debug_sampled(logger: logging.Logger, msg: str, **fields):
+    """요청마다 반복되는 대량 디버그 로그 - 레코드를 만들기 전에 레벨/샘플링을 먼저 판단"""
+    if logger.isEnabledFor(logging.DEBUG) and random.random() < LOG_SAMPLE_RATE:
+        logger.debug(msg, extra=fields)
+
+
+def setup_logging(stream=None) -> logging.Logger:
+    """app 로거를 큐 기반 핸들러로 구성 (여러 번 호출해도 한 번만 적용)"""
+    global _listener
+    logger = logging.getLogger(APP_LOGGER)
+    if _listener is not None:
+        return logger
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    if LOG_FORMAT == "text":
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s"))
+    else:
+        output.setFormatter(JsonFormatter())
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = _EnqueueHandler(log_queue)
+    handler.addFilter(ContextFilter())
+
+    logger.handlers[:] = [handler]
+    logger.setLevel(LOG_LEVEL)
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return logger
+
+
+def shutdown_logging():
+    """대기 중인 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        logging.getLogger(APP_LOGGER).handlers.clear()
+
+
+class RequestContextMiddleware:
+    """요청마다 상관 ID 설정 (X-Request-ID 헤더가 있으면 사용, 없으면 생성) 후 응답 헤더로 반환"""
+
+    def __init__(self, app, header: str = "x-request-id"):
+        self.app = app
+        self.header = header.encode("latin-1")
+        self.logger = logging.getLogger(f"{APP_LOGGER}.request")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == self.header:
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or uuid.uuid4().hex[:16]
+        token = request_id_var.set(request_id)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(self.header, request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            debug_sampled(
+                self.logger,
+                "Request completed",
+                method=scope["method"],
+                path=scope["path"],
+                status=status,
+                durationMs=round((time.perf_counter() - started) * 1000, 1),
+            )
+            request_id_var.reset(token)
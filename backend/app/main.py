@@ -3,22 +3,42 @@ idus 크롤링 API 서버
 playwright-stealth를 사용하여 봇 탐지 우회
 """
 
+import asyncio
+import logging
 import os
-import sys
-from fastapi import FastAPI, HTTPException
+import secrets
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from fastapi import FastAPI, HTTPException, Header, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field
+from typing import Optional, List, Tuple
+
+from .cache import TTLCache
+from .cache_backend import SharedCache, create_backend
+from .compact import pack_products, product_url, unpack_products
+from .identity import ProductIdentityIndex
+from .log import RequestContextMiddleware, setup_logging, shutdown_logging
+from .responses import EncodedBody, negotiate_encoding, parse_fields
+
+setup_logging()
+logger = logging.getLogger(__name__)
+logger.info("Idus crawler API loading", extra={"port": os.environ.get("PORT", "8000")})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await startup_event()
+    yield
+    await shutdown_event()
 
-print("=" * 50, file=sys.stderr, flush=True)
-print("IDUS CRAWLER API LOADING", file=sys.stderr, flush=True)
-print(f"PORT: {os.environ.get('PORT', '8000')}", file=sys.stderr, flush=True)
-print("=" * 50, file=sys.stderr, flush=True)
 
 app = FastAPI(
     title="Idus Crawler API",
     description="아이디어스 상품 검색 및 크롤링 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -28,10 +48,38 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID"],
 )
+# 요청별 상관 ID (모든 로그에 requestId로 기록)
+app.add_middleware(RequestContextMiddleware)
 
 # 전역 스크래퍼 인스턴스 (지연 로딩)
 _scraper = None
+# 전역 이미지 프록시 (지연 로딩)
+_image_proxy = None
+
+# 상품 URL/ID 변형 -> 정규 키 (상세 캐시/선행 수집/분석 중복 제거)
+_identity = ProductIdentityIndex()
+
+# 검색/상세 결과 캐시 (CACHE_BACKEND=redis면 레플리카 간 공유)
+SEARCH_CACHE_TTL = float(os.environ.get("SEARCH_CACHE_TTL", "300"))
+SEARCH_CACHE_MAX_ENTRIES = int(os.environ.get("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+DETAIL_CACHE_TTL = float(os.environ.get("DETAIL_CACHE_TTL", "600"))
+_results = SharedCache(create_backend(SEARCH_CACHE_MAX_ENTRIES), SEARCH_CACHE_TTL)
+# 필드 프로젝션별로 직렬화·압축이 끝난 응답 본문 (레플리카별)
+_search_bodies = TTLCache(SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_TTL)
+
+# 캐시 워밍 (인기 키워드 첫 페이지, 프론트엔드 페이지 크기 기준)
+WARM_PAGE_SIZE = 24
+_warmer = None
+# 검색 상위 상품 상세 선행 수집
+_prefetcher = None
+
+# 관리자 엔드포인트 토큰 (X-Admin-Token 헤더, 비어 있으면 관리자 엔드포인트 비활성)
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
+
+# 분석용 페이지 동시 수집 개수
+ANALYTICS_PAGE_CONCURRENCY = int(os.environ.get("ANALYTICS_PAGE_CONCURRENCY", "4"))
 
 
 class SearchRequest(BaseModel):
@@ -64,22 +112,151 @@ class SearchResponse(BaseModel):
     page: int
 
 
+class PriceAnalyticsRequest(BaseModel):
+    keyword: str
+    sort: str = "popular"
+    pages: int = Field(5, ge=1, le=100)
+    size: int = Field(48, ge=1, le=100)
+    bins: int = Field(20, ge=1, le=200)
+
+
 class ProductDetailRequest(BaseModel):
     url: str
 
 
 async def get_scraper():
-    """스크래퍼 인스턴스 가져오기 (지연 로딩)"""
+    """스크래퍼 인스턴스 가져오기 (지연 로딩, 브라우저는 fallback이 필요할 때 실행)"""
     global _scraper
     if _scraper is None:
-        print("Initializing scraper...", file=sys.stderr, flush=True)
         from .scraper import IdusScraper
         _scraper = IdusScraper()
-        await _scraper.initialize()
-        print("Scraper initialized!", file=sys.stderr, flush=True)
+        logger.info("Scraper initialized")
     return _scraper
 
 
+async def get_image_proxy():
+    """이미지 프록시 인스턴스 가져오기 (스크래퍼의 공유 HTTP 세션 사용)"""
+    global _image_proxy
+    if _image_proxy is None:
+        from .disk_cache import DiskLRUCache
+        from .image_proxy import ImageProxy, IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_MB
+        scraper_instance = await get_scraper()
+        cache = DiskLRUCache(IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_MB * 1024 * 1024)
+        _image_proxy = ImageProxy(scraper_instance.get_http_session, cache)
+    return _image_proxy
+
+
+def upstream_error(e: Exception) -> HTTPException:
+    """스크래퍼 예외를 HTTP 오류로 변환 (종료 중 브라우저 작업 거부는 503)"""
+    from .scraper import BrowserUnavailable
+    status_code = 503 if isinstance(e, BrowserUnavailable) else 500
+    return HTTPException(status_code=status_code, detail=str(e))
+
+
+def search_cache_key(keyword: str, sort: str, page: int, size: int) -> str:
+    return f"search:{sort}:{page}:{size}:{keyword}"
+
+
+def search_cacheable(result: dict) -> bool:
+    """빈 검색 결과는 캐시하지 않음 (API 경로는 상품이 있을 때만 반환하므로 브라우저 경로가 막힌 경우)"""
+    return bool(result["products"])
+
+
+def detail_cacheable(result: dict) -> bool:
+    """브라우저 경로가 상품 데이터를 찾지 못한 기본값(봇 차단, 느린 렌더링)은 캐시하지 않음"""
+    from .scraper import DETAIL_UNAVAILABLE_TITLE
+    return result.get("title") != DETAIL_UNAVAILABLE_TITLE
+
+
+async def search_cached(
+    keyword: str, sort: str, page: int, size: int, refresh: bool = False, background: bool = False
+) -> Tuple[dict, bool]:
+    """
+    검색 결과 캐시 조회, 없으면 스크래퍼로 검색 후 저장 (결과, 캐시 히트 여부)
+    결과의 products는 압축 행 목록 (응답 시 unpack_products로 복원)
+    background: 워머처럼 예산을 미리 받은 요청 (API 경로만 사용)
+    """
+    async def fetch():
+        scraper_instance = await get_scraper()
+        result = await scraper_instance.search_products(
+            keyword=keyword,
+            sort=sort,
+            page=page,
+            size=size,
+            background=background,
+        )
+        rows = pack_products(result["products"])
+        _identity.observe(rows)
+        return dict(result, products=rows)
+    
+    return await _results.get_or_fetch(
+        search_cache_key(keyword, sort, page, size),
+        fetch,
+        refresh=refresh,
+        background=background,
+        cacheable=search_cacheable,
+    )
+
+
+def detail_cache_key(url: str) -> str:
+    """상세 캐시 키 - URL 형태(/v2/product, /w/product, item url)와 관계없이 상품당 하나"""
+    return f"detail:{_identity.resolve(url)}"
+
+
+async def detail_cached(url: str, background: bool = False) -> Tuple[dict, bool]:
+    """
+    상품 상세 캐시 조회, 없으면 스크래퍼로 가져온 뒤 저장 (결과, 캐시 히트 여부)
+    background: 선행 수집처럼 예산을 미리 받은 요청 (HTML 경로만 사용)
+    """
+    async def fetch():
+        scraper_instance = await get_scraper()
+        return await scraper_instance.get_product_detail(url, background=background)
+    
+    return await _results.get_or_fetch(
+        detail_cache_key(url), fetch, ttl=DETAIL_CACHE_TTL, background=background, cacheable=detail_cacheable
+    )
+
+
+async def detail_is_cached(url: str) -> bool:
+    return await _results.remaining_ttl(detail_cache_key(url)) is not None
+
+
+async def prefetch_detail(url: str):
+    await detail_cached(url, background=True)
+
+
+def schedule_prefetch(http_request: Request, client_id: Optional[str], keyword: str, rows: list):
+    """검색 응답 후 상위 상품 상세 선행 수집 예약 (클라이언트: X-Client-Id 헤더, 없으면 IP)"""
+    if _prefetcher is None:
+        return
+    client = client_id or (http_request.client.host if http_request.client else "unknown")
+    _prefetcher.schedule(client, keyword, [product_url(row) for row in rows[:_prefetcher.top_n]])
+
+
+def build_search_body(keyword: str, sort: str, page: int, result: dict, field_names) -> EncodedBody:
+    """검색 응답 본문 직렬화·압축"""
+    return EncodedBody.from_payload({
+        "products": unpack_products(result["products"], field_names),
+        "total": result["total"],
+        "hasMore": result["hasMore"],
+        "keyword": keyword,
+        "sort": sort,
+        "page": page
+    })
+
+
+async def warm_search(keyword: str, sort: str):
+    """캐시 워밍 - 첫 페이지를 새로 검색하여 결과/기본 응답 본문 캐시 갱신"""
+    result, _ = await search_cached(keyword, sort, 1, WARM_PAGE_SIZE, refresh=True, background=True)
+    if not search_cacheable(result):
+        return
+    _search_bodies.set((keyword, sort, 1, WARM_PAGE_SIZE, None), build_search_body(keyword, sort, 1, result, None))
+
+
+def warm_remaining_ttl(keyword: str, sort: str) -> Optional[float]:
+    return _search_bodies.remaining_ttl((keyword, sort, 1, WARM_PAGE_SIZE, None))
+
+
 @app.get("/")
 async def root():
     """루트 엔드포인트 - 헬스체크용"""
@@ -98,50 +275,220 @@ async def api_health():
     return {"status": "healthy", "service": "idus-crawler"}
 
 
+@app.get("/api/stats")
+async def api_stats():
+    """스크래퍼 처리 통계 (API/브라우저 경로 비율, 페이지 풀 상태)"""
+    cache_stats = {
+        "results": _results.stats(),
+        "bodies": _search_bodies.stats(),
+        "warmer": _warmer.stats() if _warmer else None,
+        "prefetch": _prefetcher.stats() if _prefetcher else None,
+        "identity": _identity.stats(),
+    }
+    if _scraper is None:
+        return {"requests": {}, "browserPages": None, "searchCache": cache_stats}
+    return dict(_scraper.get_stats(), searchCache=cache_stats)
+
+
+@app.get("/api/changes")
+async def get_changes(
+    since: str = "0",
+    keyword: Optional[str] = None,
+    limit: int = Query(1000, ge=1, le=10000),
+):
+    """since 이후 가격/할인/평점/리뷰 수 변경분 (since: epoch 초 또는 ISO 8601, 다음 폴링은 until 사용)"""
+    try:
+        since_ts = float(since)
+    except ValueError:
+        try:
+            since_ts = datetime.fromisoformat(since).timestamp()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="since는 epoch 초 또는 ISO 8601 형식이어야 합니다")
+    
+    scraper_instance = await get_scraper()
+    return scraper_instance.change_feed.since(since_ts, keyword=keyword, limit=limit)
+
+
+@app.get("/api/local-search")
+async def local_search(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(24, ge=1, le=200),
+):
+    """이미 수집한 상품에서 즉시 검색 (라이브 검색 결과가 오기 전 미리보기용)"""
+    started = time.perf_counter()
+    scraper_instance = await get_scraper()
+    products = scraper_instance.local_index.search(q, limit=limit)
+    return {
+        "products": products,
+        "total": len(products),
+        "indexed": len(scraper_instance.local_index),
+        "tookMs": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
 @app.post("/api/search")
-async def search_products(request: SearchRequest):
+async def search_products(
+    request: SearchRequest,
+    http_request: Request,
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 상품 필드 (예: id,title,price,image)"),
+    accept_encoding: Optional[str] = Header(None),
+    x_client_id: Optional[str] = Header(None),
+):
     """키워드로 idus 상품 검색"""
+    field_names = parse_fields(fields, ProductItem.model_fields)
+    encoding = negotiate_encoding(accept_encoding)
+    result_key = (request.keyword, request.sort, request.page, request.size)
+    body_key = result_key + (field_names,)
+    warmed_key = request.page == 1 and request.size == WARM_PAGE_SIZE
+    
+    body = _search_bodies.get(body_key)
+    if body is not None:
+        if _warmer:
+            _warmer.record(request.keyword, request.sort, cache_hit=True, warmed_key=warmed_key)
+        if _prefetcher:
+            result = await _results.get(search_cache_key(*result_key))
+            if result is not None:
+                schedule_prefetch(http_request, x_client_id, request.keyword, result["products"])
+        return body.response(encoding, {"X-Cache": "HIT"})
+    
     try:
-        scraper_instance = await get_scraper()
-        result = await scraper_instance.search_products(
-            keyword=request.keyword,
-            sort=request.sort,
-            page=request.page,
-            size=request.size
-        )
-        
-        return {
-            "products": result["products"],
-            "total": result["total"],
-            "hasMore": result["hasMore"],
-            "keyword": request.keyword,
-            "sort": request.sort,
-            "page": request.page
-        }
+        result, cache_hit = await search_cached(request.keyword, request.sort, request.page, request.size)
     except Exception as e:
-        print(f"Search error: {e}", file=sys.stderr, flush=True)
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("Search error", extra={"keyword": request.keyword})
+        raise upstream_error(e)
+    if _warmer:
+        _warmer.record(request.keyword, request.sort, cache_hit=cache_hit, warmed_key=warmed_key)
+    
+    body = build_search_body(request.keyword, request.sort, request.page, result, field_names)
+    if search_cacheable(result):
+        _search_bodies.set(body_key, body)
+    schedule_prefetch(http_request, x_client_id, request.keyword, result["products"])
+    return body.response(encoding, {"X-Cache": "HIT" if cache_hit else "MISS"})
+
+
+@app.post("/api/analytics/prices")
+async def price_analytics(request: PriceAnalyticsRequest):
+    """키워드 검색 결과 여러 페이지를 모아 가격/할인/평점 분포 계산"""
+    from .analytics import ProductColumns, compute_price_stats
+    from .compact import ID
+    from .identity import product_key
+    
+    started = time.perf_counter()
+    rows = []
+    seen_ids = set()
+    page = 1
+    pages_fetched = 0
+    # 페이지를 ANALYTICS_PAGE_CONCURRENCY개씩 동시에 수집, 더 없으면 중단
+    while page <= request.pages:
+        batch = range(page, min(page + ANALYTICS_PAGE_CONCURRENCY, request.pages + 1))
+        try:
+            results = [result for result, _ in await asyncio.gather(*[
+                search_cached(request.keyword, request.sort, p, request.size) for p in batch
+            ])]
+        except Exception as e:
+            logger.exception("Analytics search error", extra={"keyword": request.keyword})
+            raise upstream_error(e)
+        
+        pages_fetched += len(batch)
+        for result in results:
+            for row in result["products"]:
+                key = product_key(row[ID])
+                if key not in seen_ids:
+                    seen_ids.add(key)
+                    rows.append(row)
+        if not all(result["hasMore"] for result in results):
+            break
+        page += len(batch)
+    collected = time.perf_counter()
+    
+    stats = compute_price_stats(ProductColumns.from_rows(rows), bins=request.bins)
+    return dict(
+        stats,
+        keyword=request.keyword,
+        sort=request.sort,
+        pagesFetched=pages_fetched,
+        timing={
+            "collectMs": round((collected - started) * 1000, 1),
+            "computeMs": round((time.perf_counter() - collected) * 1000, 2),
+        },
+    )
 
 
 @app.post("/api/product/detail")
 async def get_product_detail(request: ProductDetailRequest):
     """상품 URL로 상세 정보 가져오기"""
     try:
-        scraper_instance = await get_scraper()
-        result = await scraper_instance.get_product_detail(request.url)
-        return result
+        result, cache_hit = await detail_cached(request.url)
+    except Exception as e:
+        logger.exception("Product detail error", extra={"url": request.url})
+        raise upstream_error(e)
+    if _prefetcher:
+        _prefetcher.record_detail(request.url, cache_hit)
+    return result
+
+
+@app.get("/api/image")
+async def proxy_image(
+    url: str,
+    w: Optional[int] = Query(None, ge=1, le=4000),
+    if_none_match: Optional[str] = Header(None),
+):
+    """idus 이미지 프록시 - 요청 폭(w)에 맞는 사이즈 변형을 디스크 캐시에서 제공"""
+    proxy = await get_image_proxy()
+    return await proxy.respond(url, w, if_none_match)
+
+
+@app.post("/api/admin/browser/restart")
+async def restart_browser(x_admin_token: Optional[str] = Header(None)):
+    """무중단 브라우저 재시작 (새 브라우저로 전환 후 이전 브라우저는 진행 중인 페이지가 끝나면 종료)"""
+    if not ADMIN_TOKEN or not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 올바르지 않습니다")
+    scraper_instance = await get_scraper()
+    try:
+        return await scraper_instance.restart_browser()
     except Exception as e:
-        print(f"Product detail error: {e}", file=sys.stderr, flush=True)
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("Browser restart error")
+        raise upstream_error(e)
+
+
+async def startup_event():
+    """서버 시작 시 캐시 워머/상세 선행 수집 준비"""
+    global _warmer, _prefetcher
+    setup_logging()
+    from .prefetch import DetailPrefetcher, PREFETCH_ENABLED
+    from .warmer import CacheWarmer, WARM_ENABLED, WARM_SEED_KEYWORDS
+    scraper_instance = await get_scraper()
+    if PREFETCH_ENABLED:
+        _prefetcher = DetailPrefetcher(
+            prefetch_detail, detail_is_cached, scraper_instance.upstream_budget, _identity.resolve
+        )
+        logger.info("Detail prefetch enabled", extra={"topN": _prefetcher.top_n})
+    if not WARM_ENABLED:
+        return
+    seeds = [keyword.strip() for keyword in WARM_SEED_KEYWORDS.split(",") if keyword.strip()]
+    _warmer = CacheWarmer(
+        refresh=warm_search,
+        remaining_ttl=warm_remaining_ttl,
+        ttl=SEARCH_CACHE_TTL,
+        budget=scraper_instance.upstream_budget,
+        seeds=seeds,
+    )
+    _warmer.start()
+    logger.info("Cache warmer started", extra={"seeds": len(seeds)})
 
 
-@app.on_event("shutdown")
 async def shutdown_event():
-    """서버 종료 시 정리"""
-    global _scraper
+    """서버 종료 시 정리 - 새 브라우저 작업을 막고 진행 중인 페이지가 끝나기를 기다린 뒤 종료"""
+    if _warmer:
+        await _warmer.stop()
+    if _prefetcher:
+        await _prefetcher.stop()
+    if _scraper:
+        remaining = await _scraper.drain()
+        logger.info("Browser drained", extra={"abandonedPages": remaining})
+    await _results.close()
     if _scraper:
         await _scraper.close()
-        print("Browser closed", file=sys.stderr, flush=True)
-
+        logger.info("Browser closed")
+    shutdown_logging()
 
-print("FastAPI app created successfully", file=sys.stderr, flush=True)
@@ -0,0 +1,114 @@
+"""
+서버 HTML에서 상품 데이터 스크립트 추출
+__NEXT_DATA__ / JSON-LD <script>를 스트리밍으로 파싱하고, 필요한 스크립트가 닫히면 본문 읽기를 중단
+"""
+
+import codecs
+import json
+from html.parser import HTMLParser
+from typing import Optional, Dict, Any, List
+
+import aiohttp
+
+
+class ScriptDataParser(HTMLParser):
+    """__NEXT_DATA__ 와 첫 번째 JSON-LD 스크립트 본문만 수집하는 파서"""
+
+    def __init__(self):
+        super().__init__()
+        self.next_data: Optional[str] = None
+        self.json_ld: Optional[str] = None
+        self._target: Optional[str] = None
+        self._buffer: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "script":
+            return
+        attr_map = dict(attrs)
+        if attr_map.get("id") == "__NEXT_DATA__" and self.next_data is None:
+            self._target = "next"
+        elif attr_map.get("type") == "application/ld+json" and self.json_ld is None:
+            # document.querySelector와 동일하게 첫 번째 JSON-LD만 사용
+            self._target = "ld"
+        else:
+            self._target = None
+        self._buffer = []
+
+    def handle_data(self, data):
+        if self._target:
+            self._buffer.append(data)
+
+    def handle_endtag(self, tag):
+        if tag != "script" or not self._target:
+            return
+        text = "".join(self._buffer)
+        if self._target == "next":
+            self.next_data = text
+        else:
+            self.json_ld = text
+        self._target = None
+        self._buffer = []
+
+
+def _load_json(text: Optional[str]) -> Any:
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def product_from_next_data(text: Optional[str]) -> Optional[Dict]:
+    """__NEXT_DATA__에서 상품 객체 추출 (pageProps.product 또는 initialData.product)"""
+    data = _load_json(text)
+    if not isinstance(data, dict):
+        return None
+    page_props = (data.get("props") or {}).get("pageProps") or {}
+    if not isinstance(page_props, dict):
+        return None
+    initial_data = page_props.get("initialData") or {}
+    product = page_props.get("product") or (initial_data.get("product") if isinstance(initial_data, dict) else None)
+    return product or None
+
+
+def product_from_json_ld(text: Optional[str]) -> Optional[Dict]:
+    """JSON-LD에서 @type이 Product인 객체 추출"""
+    data = _load_json(text)
+    if isinstance(data, dict) and data.get("@type") == "Product":
+        return data
+    return None
+
+
+async def read_detail_payload(response: aiohttp.ClientResponse, chunk_size: int = 16384) -> Optional[Dict]:
+    """
+    응답 본문을 청크 단위로 파싱하여 상품 상세 데이터 반환
+    우선순위는 브라우저 경로와 동일 (__NEXT_DATA__ → JSON-LD)
+    """
+    parser = ScriptDataParser()
+    decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+    next_product = None
+    next_checked = False
+    finished = False
+
+    async for chunk in response.content.iter_chunked(chunk_size):
+        parser.feed(decoder.decode(chunk))
+        if parser.next_data is not None:
+            if not next_checked:
+                next_product = product_from_next_data(parser.next_data)
+                next_checked = True
+            # __NEXT_DATA__에 상품이 있거나, 없더라도 JSON-LD까지 확보했으면 더 읽을 필요 없음
+            if next_product or parser.json_ld is not None:
+                break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+        finished = True
+
+    if not finished:
+        # 남은 본문은 읽지 않고 연결 종료
+        response.close()
+
+    if next_product:
+        return next_product
+    return product_from_json_ld(parser.json_ld)
@@ -0,0 +1,154 @@
+"""
+검색 상위 상품 상세 선행 수집
+검색 응답 후 상위 N개 상품의 상세를 업스트림 예산 안에서 낮은 우선순위로 미리 받아 상세 캐시에 저장
+브라우저 대체 없이 HTML 경로만 사용하여 사용자 요청의 브라우저 페이지 슬롯을 차지하지 않음
+클라이언트가 다른 키워드로 넘어가면 아직 시작하지 않은 선행 수집은 취소
+상품은 정규 키로 추적하여 여러 키워드/URL 형태로 나온 같은 상품은 한 번만 수집
+"""
+
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Set
+
+from .ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_ENABLED = os.environ.get("PREFETCH_ENABLED", "0") == "1"
+PREFETCH_TOP_N = int(os.environ.get("PREFETCH_TOP_N", "3"))
+PREFETCH_CONCURRENCY = int(os.environ.get("PREFETCH_CONCURRENCY", "2"))
+# 추적하는 클라이언트 / 선행 수집 상품 최대 개수
+PREFETCH_MAX_CLIENTS = 10000
+PREFETCH_MAX_TRACKED_URLS = 20000
+
+
+class _ClientJob:
+    """클라이언트별 현재 키워드와 취소 여부"""
+
+    __slots__ = ("keyword", "cancelled")
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+        self.cancelled = False
+
+
+class DetailPrefetcher:
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[object]],
+        is_cached: Callable[[str], Awaitable[bool]],
+        budget: TokenBucket,
+        identify: Callable[[str], str],
+        top_n: int = PREFETCH_TOP_N,
+        concurrency: int = PREFETCH_CONCURRENCY,
+    ):
+        self._fetch = fetch
+        self._is_cached = is_cached
+        self._identify = identify
+        self._budget = budget
+        self.top_n = top_n
+        self._slots = asyncio.Semaphore(concurrency)
+        self._clients: "OrderedDict[str, _ClientJob]" = OrderedDict()
+        # 선행 수집했고 아직 사용자 상세 요청이 오지 않은 상품 키
+        self._prefetched: "OrderedDict[str, None]" = OrderedDict()
+        # 다른 클라이언트 작업이 수집 중인 상품 키
+        self._inflight: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self.prefetched = 0
+        self.already_cached = 0
+        self.cancelled = 0
+        self.failed = 0
+        self.skipped_budget = 0
+        self.detail_requests = 0
+        self.hits = 0
+
+    def schedule(self, client_id: str, keyword: str, urls: List[str]):
+        """검색 응답 후 호출 - 같은 클라이언트의 이전 키워드 선행 수집은 취소"""
+        job = self._clients.get(client_id)
+        if job is None or job.keyword != keyword:
+            if job is not None:
+                job.cancelled = True
+            job = _ClientJob(keyword)
+            self._clients[client_id] = job
+        self._clients.move_to_end(client_id)
+        while len(self._clients) > PREFETCH_MAX_CLIENTS:
+            self._clients.popitem(last=False)
+
+        # 같은 검색 결과 안의 중복 상품 제거 (URL 형태가 달라도 키가 같으면 하나)
+        targets = {}
+        for url in urls[:self.top_n]:
+            if url:
+                targets.setdefault(self._identify(url), url)
+        if targets:
+            task = asyncio.create_task(self._run(job, targets))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job: _ClientJob, targets: Dict[str, str]):
+        for key, url in targets.items():
+            if job.cancelled:
+                self.cancelled += 1
+                continue
+            # 캐시 만료 후에는 다시 선행 수집 (_prefetched는 히트 집계용)
+            if key in self._inflight or await self._is_cached(url):
+                self.already_cached += 1
+                continue
+            # 버스트의 절반은 사용자 요청 몫으로 남겨둠 (fetch는 예산을 다시 소모하지 않고 HTML 경로만 사용)
+            if not self._budget.try_acquire(reserve=self._budget.burst / 2):
+                self.skipped_budget += 1
+                break
+            async with self._slots:
+                if job.cancelled:
+                    self.cancelled += 1
+                    continue
+                # 진행 중에 들어온 사용자 요청도 캐시에서 합쳐지므로 시작 전에 표시
+                self._track(key)
+                self._inflight.add(key)
+                self.prefetched += 1
+                try:
+                    await self._fetch(url)
+                except Exception as e:
+                    self._prefetched.pop(key, None)
+                    self.prefetched -= 1
+                    self.failed += 1
+                    logger.warning("Detail prefetch failed: %s", e, extra={"url": url})
+                finally:
+                    self._inflight.discard(key)
+
+    def _track(self, key: str):
+        self._prefetched[key] = None
+        while len(self._prefetched) > PREFETCH_MAX_TRACKED_URLS:
+            self._prefetched.popitem(last=False)
+
+    def record_detail(self, url: str, cache_hit: bool):
+        """사용자 상세 요청 기록 (선행 수집한 상품이 캐시에서 제공됐으면 히트)"""
+        self.detail_requests += 1
+        key = self._identify(url)
+        if key in self._prefetched:
+            del self._prefetched[key]
+            if cache_hit:
+                self.hits += 1
+
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def stats(self) -> Dict:
+        return {
+            "topN": self.top_n,
+            "running": len(self._tasks),
+            "prefetched": self.prefetched,
+            "alreadyCached": self.already_cached,
+            "cancelled": self.cancelled,
+            "failed": self.failed,
+            "skippedForBudget": self.skipped_budget,
+            "detailRequests": self.detail_requests,
+            "prefetchHits": self.hits,
+            # 선행 수집 중 실제로 사용된 비율 / 상세 요청 중 선행 수집으로 제공된 비율
+            "hitRatio": round(self.hits / self.prefetched, 3) if self.prefetched else None,
+            "coverage": round(self.hits / self.detail_requests, 3) if self.detail_requests else None,
+        }
@@ -0,0 +1,37 @@
+"""
+업스트림(idus) 요청 예산 - 토큰 버킷
+사용자 요청은 막지 않고 토큰만 소모, 백그라운드 작업은 예비분(reserve)을 남기고 남는 토큰만 사용
+"""
+
+import time
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def consume(self, amount: float = 1.0):
+        """사용자 요청 - 항상 허용, 예산을 초과하면 빚으로 남겨 백그라운드 작업이 물러나게 함"""
+        self._refill()
+        self._tokens = max(-self.burst, self._tokens - amount)
+
+    def try_acquire(self, amount: float = 1.0, reserve: float = 0.0) -> bool:
+        """백그라운드 요청 - reserve 이상 남는 경우에만 토큰 사용"""
+        self._refill()
+        if self._tokens - amount < reserve:
+            return False
+        self._tokens -= amount
+        return True
@@ -0,0 +1,78 @@
+"""
+검색 응답 직렬화
+필드 프로젝션, orjson 인코딩, Accept-Encoding에 따른 gzip/brotli 압축
+캐시에는 인코딩/압축이 끝난 본문(EncodedBody)을 저장하여 히트 시 직렬화를 건너뜀
+"""
+
+import gzip
+from typing import Dict, Iterable, Optional, Tuple
+
+import brotli
+import orjson
+from fastapi import HTTPException
+from fastapi.responses import Response
+
+# 이보다 작은 본문은 압축하지 않음
+MIN_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[Tuple[str, ...]]:
+    """fields=id,title,price 파싱 (id는 항상 포함, 정렬된 튜플로 캐시 키에 사용)"""
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 필드: {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return tuple(sorted(requested))
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> str:
+    """Accept-Encoding에서 br > gzip > identity 순으로 선택 (q=0은 제외)"""
+    if not accept_encoding:
+        return "identity"
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ("br", "gzip"):
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return "identity"
+
+
+class EncodedBody:
+    """직렬화된 JSON 본문과 미리 압축한 변형"""
+    __slots__ = ("identity", "gzip", "br")
+
+    def __init__(self, identity: bytes):
+        self.identity = identity
+        if len(identity) >= MIN_COMPRESS_SIZE:
+            self.gzip = gzip.compress(identity, compresslevel=GZIP_LEVEL)
+            self.br = brotli.compress(identity, quality=BROTLI_QUALITY)
+        else:
+            self.gzip = None
+            self.br = None
+
+    @classmethod
+    def from_payload(cls, payload) -> "EncodedBody":
+        return cls(orjson.dumps(payload))
+
+    def response(self, encoding: str, headers: Optional[Dict[str, str]] = None) -> Response:
+        headers = dict(headers or {}, Vary="Accept-Encoding")
+        body = getattr(self, encoding, None) if encoding != "identity" else None
+        if body is None:
+            body = self.identity
+        else:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
@@ -4,38 +4,441 @@ idus 크롤러 - playwright-stealth 사용
 """
 
 import asyncio
+import dataclasses
 import json
+import logging
+import os
 import re
+import time
 import aiohttp
-from typing import Optional, Dict, List, Any, Tuple
+from collections import Counter
+from typing import Optional, Dict, List, Any, Tuple, Set
 from playwright.async_api import async_playwright, Browser, Page
 from playwright_stealth import stealth_async
 
+from .asset_cache import BrowserAssetCache, create_asset_cache
+from .changes import ChangeFeed
+from .local_index import LocalProductIndex
+from .log import debug_sampled
+from .page_data import read_detail_payload
+from .ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# idus 기본 URL (부하 테스트 시 loadtest/fake_idus.py 같은 로컬 서버로 교체 가능)
+IDUS_BASE_URL = os.environ.get("IDUS_BASE_URL", "https://www.idus.com").rstrip("/")
+IDUS_IMAGE_BASE_URL = os.environ.get("IDUS_IMAGE_BASE_URL", "https://image.idus.com").rstrip("/")
+
+# idus 요청 예산 (초당 요청 수, 버스트) - 캐시 워밍 등 백그라운드 작업은 이 안에서만 실행
+UPSTREAM_RPS = float(os.environ.get("UPSTREAM_RPS", "5"))
+UPSTREAM_BURST = float(os.environ.get("UPSTREAM_BURST", "20"))
+
+# 동시에 열 수 있는 브라우저 페이지 수 (스크롤 커서가 잡고 있는 페이지 포함)
+MAX_BROWSER_PAGES = int(os.environ.get("MAX_BROWSER_PAGES", "4"))
+# 스크롤 커서 유휴 유지 시간 (초)
+SCROLL_CURSOR_TTL = float(os.environ.get("SCROLL_CURSOR_TTL", "60"))
+# 종료/재시작 시 진행 중인 브라우저 페이지를 기다리는 최대 시간 (초)
+BROWSER_DRAIN_TIMEOUT = float(os.environ.get("BROWSER_DRAIN_TIMEOUT", "25"))
+# 브라우저 비정상 종료 후 재실행 실패 시 대기 간격 (초, 실패할 때마다 두 배)
+BROWSER_RELAUNCH_BACKOFF = 1.0
+BROWSER_RELAUNCH_MAX_BACKOFF = 30.0
+CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+]
+
+
+# 브라우저 경로에서 상품 데이터를 찾지 못했을 때 반환하는 기본값의 제목 (캐시하지 않음)
+DETAIL_UNAVAILABLE_TITLE = "상품 정보를 가져올 수 없습니다"
+
+# DOM에서 추출한 상품 표시 (압축 행/응답에는 포함되지 않음)
+DOM_EXTRACTED = "_fromDom"
+
+# 검색 결과 DOM에서 상품 카드 추출 (idus v2 검색 페이지 구조, benchmarks에서도 사용)
+DOM_PRODUCTS_SCRIPT = """
+(baseUrl) => {
+    const products = [];
+    // 모든 상품 링크 찾기
+    const links = document.querySelectorAll('a[href*="/v2/product/"], a[href*="/w/product/"]');
+    
+    for (const link of links) {
+        try {
+            const href = link.getAttribute('href') || '';
+            
+            // 상품 ID 추출
+            const match = href.match(/\\/(?:v2|w)\\/product\\/([a-f0-9-]+)/i);
+            if (!match) continue;
+            const productId = match[1];
+            
+            // 이미 추가된 상품인지 확인
+            if (products.some(p => p.id === productId)) continue;
+            
+            // 이미지 URL 추출 (다양한 속성 확인)
+            const img = link.querySelector('img');
+            let imageUrl = '';
+            if (img) {
+                // 우선순위: src > data-src > srcset > data-lazy > style background
+                imageUrl = img.src || '';
+                
+                // src가 base64나 placeholder면 다른 속성 확인
+                if (!imageUrl || imageUrl.includes('data:') || imageUrl.includes('placeholder') || imageUrl.length < 20) {
+                    imageUrl = img.dataset.src || img.getAttribute('data-src') || '';
+                }
+                
+                if (!imageUrl) {
+                    imageUrl = img.getAttribute('data-lazy') || img.getAttribute('data-original') || '';
+                }
+                
+                // srcset에서 추출
+                if (!imageUrl && img.srcset) {
+                    const srcsetParts = img.srcset.split(',')[0];
+                    if (srcsetParts) {
+                        imageUrl = srcsetParts.trim().split(' ')[0];
+                    }
+                }
+                
+                // 배경 이미지 확인
+                if (!imageUrl) {
+                    const style = img.style.backgroundImage;
+                    if (style) {
+                        const match = style.match(/url\\(['"]?([^'"\\)]+)['"]?\\)/);
+                        if (match) imageUrl = match[1];
+                    }
+                }
+            }
+            
+            // 이미지가 없으면 부모에서 찾기
+            if (!imageUrl) {
+                const parentImg = link.closest('div')?.querySelector('img');
+                if (parentImg) {
+                    imageUrl = parentImg.src || parentImg.dataset.src || '';
+                }
+            }
+            
+            // URL 정규화
+            if (imageUrl) {
+                if (imageUrl.startsWith('//')) {
+                    imageUrl = 'https:' + imageUrl;
+                } else if (imageUrl.startsWith('/')) {
+                    imageUrl = baseUrl + imageUrl;
+                }
+                // base64나 placeholder 제거
+                if (imageUrl.includes('data:') || imageUrl.includes('placeholder') || imageUrl.length < 30) {
+                    imageUrl = '';
+                }
+            }
+            
+            // 링크의 전체 텍스트에서 정보 추출
+            const fullText = link.innerText || link.textContent || '';
+            
+            // 가격 추출 (숫자,숫자 원 또는 숫자원 패턴)
+            const priceMatches = fullText.match(/([0-9,]+)\\s*원/g) || [];
+            let price = 0;
+            let originalPrice = null;
+            
+            if (priceMatches.length > 0) {
+                // 첫 번째 가격 (원가 또는 할인가)
+                const firstPrice = parseInt(priceMatches[0].replace(/[^0-9]/g, '')) || 0;
+                
+                if (priceMatches.length >= 2) {
+                    // 두 번째 가격이 있으면 첫 번째가 원가, 두 번째가 할인가
+                    originalPrice = firstPrice;
+                    price = parseInt(priceMatches[1].replace(/[^0-9]/g, '')) || firstPrice;
+                } else {
+                    price = firstPrice;
+                }
+            }
+            
+            // 평점 추출 (4.8, 5.0 등의 패턴)
+            const ratingMatch = fullText.match(/([0-5]\\.[0-9])\\s*\\(([0-9,]+)\\)/);
+            const rating = ratingMatch ? parseFloat(ratingMatch[1]) : 0;
+            const reviewCount = ratingMatch ? parseInt(ratingMatch[2].replace(/,/g, '')) : 0;
+            
+            // 할인율 추출
+            const discountMatch = fullText.match(/([0-9]+)%/);
+            const discountRate = discountMatch ? parseInt(discountMatch[1]) : null;
+            
+            // 텍스트 분석하여 작가명과 상품명 분리
+            // 패턴: "작가명 상품명 가격원..."
+            const lines = fullText.split('\\n').map(l => l.trim()).filter(l => l);
+            
+            let artistName = '작가';
+            let title = '';
+            
+            // 첫 번째 줄이 작가명인 경우가 많음
+            if (lines.length >= 2) {
+                // 첫 번째 줄에 "원"이나 숫자가 많으면 작가명+상품명 혼합
+                const firstLine = lines[0];
+                if (!/[0-9,]+\\s*원/.test(firstLine) && firstLine.length < 30) {
+                    artistName = firstLine;
+                    // 두 번째 줄부터 상품명 찾기
+                    for (let i = 1; i < lines.length; i++) {
+                        if (!/[0-9,]+\\s*원/.test(lines[i]) && !lines[i].includes('%') && lines[i].length > 5) {
+                            title = lines[i];
+                            break;
+                        }
+                    }
+                } else {
+                    // 첫 줄에서 분리 시도 (예: "소소페인팅 밤하늘의 펄 물감폰케이스")
+                    const parts = firstLine.split(/\\s+/);
+                    if (parts.length >= 2) {
+                        artistName = parts[0];
+                        title = parts.slice(1).join(' ');
+                    }
+                }
+            }
+            
+            // 상품명이 비어있으면 전체 텍스트에서 추출
+            if (!title) {
+                // 가격, 평점 등 제거하고 상품명 추출
+                title = fullText
+                    .replace(/[0-9,]+\\s*원/g, '')
+                    .replace(/[0-9]+%/g, '')
+                    .replace(/[0-5]\\.[0-9]\\s*\\([0-9,]+\\)/g, '')
+                    .replace(/멤버십.*할인/g, '')
+                    .replace(/쿠폰/g, '')
+                    .replace(/후기.*/g, '')
+                    .replace(/살수록할인/g, '')
+                    .trim()
+                    .split('\\n')[0]
+                    .trim();
+                
+                // 너무 길면 자르기
+                if (title.length > 100) {
+                    title = title.substring(0, 100);
+                }
+            }
+            
+            if (!title || title.length < 2) {
+                title = `상품 ${products.length + 1}`;
+            }
+            
+            products.push({
+                id: productId,
+                title: title,
+                price: price,
+                originalPrice: originalPrice,
+                discountRate: discountRate,
+                image: imageUrl,
+                artistName: artistName,
+                rating: rating,
+                reviewCount: reviewCount,
+                url: baseUrl + '/v2/product/' + productId,
+            });
+            
+        } catch (e) {
+            console.error('Error parsing product:', e);
+        }
+    }
+    
+    return products;
+}
+"""
+
+@dataclasses.dataclass
+class ScrollCursor:
+    """브라우저 경로 페이지네이션 커서 - (keyword, sort)별로 살아있는 페이지를 유지"""
+    page: Page
+    size: int
+    next_page: int = 1
+    seen_ids: Set[str] = dataclasses.field(default_factory=set)
+    pending: List[Dict] = dataclasses.field(default_factory=list)
+    exhausted: bool = False
+    last_used: float = dataclasses.field(default_factory=time.monotonic)
+    lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock)
+
+
+class BrowserUnavailable(Exception):
+    """서버 종료 중이라 새 브라우저 작업을 받지 않음"""
+
+
+class BackgroundFetchFailed(Exception):
+    """백그라운드(워밍/선행 수집) 요청이 HTTP 경로로 처리되지 않음 - 브라우저로 대체하지 않음"""
+
 
 class IdusScraper:
     def __init__(self):
         self.browser: Optional[Browser] = None
         self.playwright = None
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        self._page_slots = asyncio.Semaphore(MAX_BROWSER_PAGES)
+        # 열린 페이지 -> 해당 페이지를 만든 브라우저 (재시작 시 이전 브라우저의 페이지가 끝나기를 기다림)
+        self._page_browsers: Dict[Page, Browser] = {}
+        self._launch_lock = asyncio.Lock()
+        self._accepting = True
+        self._closing = False
+        self._relaunch_task: Optional[asyncio.Task] = None
+        self.browser_disconnects = 0
+        self.browser_restarts = 0
+        self._cursors: Dict[Tuple[str, str], ScrollCursor] = {}
+        self._cursor_sweeper: Optional[asyncio.Task] = None
+        # 경로별 처리 횟수 (API/HTML vs 브라우저)
+        self.stats: Counter = Counter()
+        # 가격/리뷰 변경 피드
+        self.change_feed = ChangeFeed()
+        # 수집한 상품 로컬 전문 검색 인덱스
+        self.local_index = LocalProductIndex()
+        # idus 요청 예산
+        self.upstream_budget = TokenBucket(UPSTREAM_RPS, UPSTREAM_BURST)
+        # 브라우저 페이지가 공유하는 정적 리소스 디스크 캐시 (브라우저 실행 시 생성)
+        self.asset_cache: Optional[BrowserAssetCache] = None
         
+    def _browser_ready(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+    
     async def initialize(self):
-        """브라우저 초기화"""
-        if self.browser is None:
+        """브라우저 초기화 (연결이 끊긴 브라우저는 다시 실행)"""
+        if not self._accepting:
+            raise BrowserUnavailable("서버 종료 중에는 브라우저 작업을 받지 않습니다")
+        if self._browser_ready():
+            return
+        async with self._launch_lock:
+            if self._browser_ready():
+                return
+            self.browser = await self._launch_browser()
+            if self._cursor_sweeper is None:
+                self._cursor_sweeper = asyncio.create_task(self._sweep_cursors())
+            if self.asset_cache is None:
+                self.asset_cache = create_asset_cache()
+    
+    async def _launch_browser(self) -> Browser:
+        if self.playwright is None:
             self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--disable-gpu',
-                    '--window-size=1920,1080',
-                ]
+        browser = await self.playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        browser.on("disconnected", self._on_browser_disconnected)
+        logger.info("Browser launched")
+        return browser
+    
+    def _on_browser_disconnected(self, browser: Browser):
+        """Chromium 비정상 종료 감지 - 백그라운드에서 다시 실행 (직접 닫은 브라우저는 무시)"""
+        if browser is not self.browser or self._closing:
+            return
+        logger.error("Browser disconnected, relaunching in background")
+        self.browser_disconnects += 1
+        self.browser = None
+        if self._relaunch_task is None or self._relaunch_task.done():
+            self._relaunch_task = asyncio.create_task(self._relaunch(browser))
+    
+    async def _relaunch(self, dead: Browser):
+        await self._drop_browser_cursors(dead)
+        delay = BROWSER_RELAUNCH_BACKOFF
+        while self._accepting and not self._closing and not self._browser_ready():
+            try:
+                await self.initialize()
+            except BrowserUnavailable:
+                return
+            except Exception as e:
+                logger.warning("Browser relaunch failed: %s", e, extra={"retryIn": delay})
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, BROWSER_RELAUNCH_MAX_BACKOFF)
+    
+    async def _drop_browser_cursors(self, browser: Browser):
+        """해당 브라우저 페이지를 잡고 있는 유휴 스크롤 커서 정리"""
+        for key, cursor in list(self._cursors.items()):
+            if self._page_browsers.get(cursor.page) is browser and not cursor.lock.locked():
+                await self._drop_cursor(key)
+    
+    def _pages_on(self, browser: Browser) -> int:
+        return sum(1 for owner in self._page_browsers.values() if owner is browser)
+    
+    async def _wait_for_pages(self, browser: Optional[Browser], timeout: float) -> int:
+        """browser(None이면 전체)의 페이지가 모두 반환될 때까지 대기, 제한 시간이 지나면 남은 페이지 수 반환"""
+        deadline = time.monotonic() + timeout
+        while True:
+            targets = [browser] if browser else set(self._page_browsers.values())
+            for target in targets:
+                await self._drop_browser_cursors(target)
+            remaining = self._pages_on(browser) if browser else len(self._page_browsers)
+            if not remaining or time.monotonic() >= deadline:
+                return remaining
+            await asyncio.sleep(0.1)
+    
+    async def restart_browser(self, timeout: float = BROWSER_DRAIN_TIMEOUT) -> Dict[str, Any]:
+        """
+        무중단 브라우저 재시작 - 새 브라우저를 먼저 띄워 새 페이지는 그쪽에서 열고,
+        이전 브라우저는 진행 중인 페이지가 끝나면(최대 timeout초) 종료
+        """
+        if not self._accepting:
+            raise BrowserUnavailable("서버 종료 중에는 브라우저 작업을 받지 않습니다")
+        started = time.monotonic()
+        async with self._launch_lock:
+            old = self.browser
+            if old is None:
+                return {"restarted": False, "reason": "browser not running"}
+            self.browser = await self._launch_browser()
+        self.browser_restarts += 1
+        
+        abandoned = await self._wait_for_pages(old, timeout)
+        if abandoned:
+            logger.warning("Closing old browser with pages still open", extra={"pages": abandoned})
+        try:
+            await old.close()
+        except Exception as e:
+            logger.warning("Old browser close error: %s", e)
+        logger.info("Browser restarted", extra={"abandonedPages": abandoned})
+        return {
+            "restarted": True,
+            "abandonedPages": abandoned,
+            "tookMs": round((time.monotonic() - started) * 1000),
+        }
+    
+    async def drain(self, timeout: float = BROWSER_DRAIN_TIMEOUT) -> int:
+        """종료 준비 - 새 브라우저 작업을 받지 않고 진행 중인 페이지가 끝날 때까지 대기 (남은 페이지 수 반환)"""
+        self._accepting = False
+        remaining = await self._wait_for_pages(None, timeout)
+        if remaining:
+            logger.warning("Drain timed out", extra={"pages": remaining})
+        return remaining
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """경로별 처리 횟수 및 페이지 풀 상태"""
+        return {
+            "requests": dict(self.stats),
+            "browserPages": {
+                "max": MAX_BROWSER_PAGES,
+                "available": self._page_slots._value,
+                "scrollCursors": len(self._cursors),
+            },
+            "browser": {
+                "connected": self._browser_ready(),
+                "accepting": self._accepting,
+                "openPages": len(self._page_browsers),
+                "disconnects": self.browser_disconnects,
+                "restarts": self.browser_restarts,
+            },
+            "assetCache": self.asset_cache.stats() if self.asset_cache else None,
+        }
+    
+    async def get_http_session(self) -> aiohttp.ClientSession:
+        """공유 HTTP 세션 (커넥션/DNS 재사용)"""
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30),
             )
-            print("Browser initialized successfully")
+        return self.http_session
     
     async def close(self):
-        """브라우저 종료"""
+        """브라우저 및 HTTP 세션 종료"""
+        self._closing = True
+        self._accepting = False
+        if self._relaunch_task:
+            self._relaunch_task.cancel()
+            self._relaunch_task = None
+        if self._cursor_sweeper:
+            self._cursor_sweeper.cancel()
+            self._cursor_sweeper = None
+        for key in list(self._cursors):
+            await self._drop_cursor(key)
+        if self.http_session:
+            await self.http_session.close()
+            self.http_session = None
         if self.browser:
             await self.browser.close()
             self.browser = None
@@ -43,14 +446,17 @@ class IdusScraper:
             await self.playwright.stop()
             self.playwright = None
     
-    async def _create_stealth_page(self) -> Page:
+    async def _create_stealth_page(self, browser: Browser) -> Page:
         """stealth 모드가 적용된 페이지 생성"""
-        context = await self.browser.new_context(
+        context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            user_agent=USER_AGENT,
             locale='ko-KR',
             timezone_id='Asia/Seoul',
         )
+        # 정적 리소스는 컨텍스트 간 공유 디스크 캐시에서 (쿠키/스토리지는 컨텍스트별로 격리 유지)
+        if self.asset_cache:
+            await self.asset_cache.attach(context)
         page = await context.new_page()
         
         # stealth 모드 적용
@@ -63,28 +469,141 @@ class IdusScraper:
         
         return page
     
+    async def _acquire_page(self) -> Page:
+        """페이지 풀 슬롯을 확보한 뒤 stealth 페이지 생성 (풀이 가득 차면 유휴 커서부터 정리)"""
+        await self._evict_idle_cursors()
+        if self._page_slots.locked():
+            await self._evict_idle_cursors(force_lru=True)
+        await self._page_slots.acquire()
+        try:
+            # 대기하는 사이 브라우저가 재실행/교체됐을 수 있으므로 현재 브라우저 확인
+            await self.initialize()
+            browser = self.browser
+            page = await self._create_stealth_page(browser)
+        except Exception:
+            self._page_slots.release()
+            raise
+        self._page_browsers[page] = browser
+        return page
+    
+    async def _release_page(self, page: Page):
+        """페이지 컨텍스트 종료 후 풀 슬롯 반환"""
+        self._page_browsers.pop(page, None)
+        try:
+            await page.context.close()
+        except Exception as e:
+            logger.warning("Page close error: %s", e)
+        finally:
+            self._page_slots.release()
+    
+    async def _drop_cursor(self, key: Tuple[str, str]):
+        """커서 제거 및 페이지 반환"""
+        cursor = self._cursors.pop(key, None)
+        if cursor:
+            await self._release_page(cursor.page)
+    
+    async def _evict_idle_cursors(self, force_lru: bool = False):
+        """TTL이 지난 유휴 커서 정리 (force_lru면 만료 커서가 없어도 가장 오래된 유휴 커서 1개 정리)"""
+        now = time.monotonic()
+        idle = [(c.last_used, key) for key, c in self._cursors.items() if not c.lock.locked()]
+        expired = [key for last_used, key in idle if now - last_used > SCROLL_CURSOR_TTL]
+        if force_lru and not expired and idle:
+            expired.append(min(idle)[1])
+        for key in expired:
+            logger.info("Evicting scroll cursor", extra={"keyword": key[0], "sort": key[1]})
+            await self._drop_cursor(key)
+    
+    async def _sweep_cursors(self):
+        """유휴 커서 주기적 정리"""
+        while True:
+            await asyncio.sleep(max(SCROLL_CURSOR_TTL / 2, 1))
+            try:
+                await self._evict_idle_cursors()
+            except Exception:
+                logger.exception("Cursor sweep error")
+    
     async def search_products(
         self, 
         keyword: str, 
         sort: str = "popular",
         page: int = 1,
-        size: int = 24
+        size: int = 24,
+        background: bool = False,
     ) -> Dict[str, Any]:
         """
         키워드로 상품 검색 - API 우선, 실패 시 브라우저 크롤링
+        background: 예산을 try_acquire로 이미 받은 백그라운드 요청 (예산을 다시 소모하지 않고 브라우저 대체 없음)
         """
+        if not background:
+            self.upstream_budget.consume()
+        
         # 1. 먼저 idus API 직접 호출 시도
         try:
             api_result = await self._search_via_api(keyword, sort, page, size)
             if api_result and len(api_result.get("products", [])) > 0:
-                print(f"API method succeeded: {len(api_result['products'])} products")
+                debug_sampled(logger, "API method succeeded", products=len(api_result["products"]))
+                self.stats["search_api"] += 1
+                self._on_products(keyword, api_result["products"])
                 return api_result
         except Exception as e:
-            print(f"API method failed: {e}")
+            logger.warning("API method failed: %s", e, extra={"keyword": keyword})
         
-        # 2. API 실패 시 브라우저 크롤링
-        print("Falling back to browser crawling...")
+        # 2. API 실패 시 브라우저 크롤링 (사용자 요청만)
+        if background:
+            raise BackgroundFetchFailed("API 검색 실패 (백그라운드 요청은 브라우저를 사용하지 않음)")
+        logger.info("Falling back to browser crawling", extra={"keyword": keyword, "page": page})
+        self.stats["search_browser"] += 1
         await self.initialize()
+        result = await self._search_via_browser(keyword, sort, page, size)
+        self._on_products(keyword, result["products"])
+        return result
+    
+    def _on_products(self, keyword: str, products: List[Dict]):
+        """검색으로 정규화된 상품 후처리 (변경 피드 기록, 로컬 인덱스 갱신)"""
+        try:
+            # DOM 추출 상품은 할인/평점/리뷰 값이 추정치라 변경 피드 기준값으로 쓰지 않음
+            changed = self.change_feed.observe(keyword, [p for p in products if not p.get(DOM_EXTRACTED)])
+            if changed:
+                debug_sampled(logger, "Recorded product changes", products=changed)
+        except Exception:
+            logger.exception("Change feed error")
+        try:
+            self.local_index.add_products(products)
+        except Exception:
+            logger.exception("Local index error")
+    
+    async def _search_via_browser(
+        self,
+        keyword: str,
+        sort: str,
+        page: int,
+        size: int
+    ) -> Dict[str, Any]:
+        """
+        브라우저 검색 - (keyword, sort)별 스크롤 커서를 유지하여
+        다음 페이지 요청 시 페이지를 다시 로드하지 않고 이어서 스크롤
+        """
+        key = (keyword, sort)
+        cursor = self._cursors.get(key)
+        
+        if cursor:
+            async with cursor.lock:
+                if self._cursors.get(key) is cursor and cursor.next_page == page and cursor.size == size:
+                    logger.debug("Continuing scroll cursor", extra={"keyword": keyword, "sort": sort, "page": page})
+                    try:
+                        await self._fill_cursor(cursor, size)
+                        result = self._take_cursor_page(cursor, page, size)
+                    except Exception as e:
+                        logger.warning("Scroll cursor error: %s", e, extra={"keyword": keyword})
+                        await self._drop_cursor(key)
+                        raise e
+                    if not result["hasMore"]:
+                        await self._drop_cursor(key)
+                    logger.debug("Browser search found products", extra={"products": len(result["products"]), "page": page})
+                    return result
+            # 순서가 맞지 않는 요청 - 기존 커서를 버리고 새로 시작
+            if self._cursors.get(key) is cursor:
+                await self._drop_cursor(key)
         
         # 정렬 매핑
         sort_map = {
@@ -96,56 +615,110 @@ class IdusScraper:
         }
         sort_value = sort_map.get(sort, "popular")
         
-        search_url = f"https://www.idus.com/v2/search?keyword={keyword}&order={sort_value}"
+        search_url = f"{IDUS_BASE_URL}/v2/search?keyword={keyword}&order={sort_value}"
         
-        browser_page = await self._create_stealth_page()
+        browser_page = await self._acquire_page()
+        cursor = ScrollCursor(page=browser_page, size=size)
         
-        try:
-            print(f"Navigating to: {search_url}")
-            
-            # 페이지 로드
-            await browser_page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
-            
-            # 상품이 로드될 때까지 대기
-            await browser_page.wait_for_timeout(2000)
-            
-            # 스크롤하여 lazy loading 이미지 트리거
-            await browser_page.evaluate("""
-                async () => {
-                    // 부드럽게 스크롤하여 이미지 로드 트리거
-                    for (let i = 0; i < 3; i++) {
-                        window.scrollBy(0, window.innerHeight);
+        async with cursor.lock:
+            try:
+                logger.debug("Navigating", extra={"url": search_url})
+                
+                # 페이지 로드
+                await browser_page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
+                
+                # 상품이 로드될 때까지 대기
+                await browser_page.wait_for_timeout(2000)
+                
+                # 스크롤하여 lazy loading 이미지 트리거
+                await browser_page.evaluate("""
+                    async () => {
+                        // 부드럽게 스크롤하여 이미지 로드 트리거
+                        for (let i = 0; i < 3; i++) {
+                            window.scrollBy(0, window.innerHeight);
+                            await new Promise(r => setTimeout(r, 500));
+                        }
+                        // 다시 위로
+                        window.scrollTo(0, 0);
                         await new Promise(r => setTimeout(r, 500));
                     }
-                    // 다시 위로
-                    window.scrollTo(0, 0);
-                    await new Promise(r => setTimeout(r, 500));
+                """)
+                
+                # 이미지 로드 대기
+                await browser_page.wait_for_timeout(2000)
+                
+                # __NEXT_DATA__ 또는 __NUXT_DATA__에서 첫 화면 데이터 추출
+                skip = (page - 1) * size
+                products = await self._extract_products_from_page(browser_page, skip + size)
+                
+                if not products:
+                    logger.debug("No products found in page data, trying DOM extraction")
+                    products = await self._extract_products_from_dom(browser_page, skip + size)
+                
+                self._add_cursor_products(cursor, products)
+                
+                # 요청 페이지까지 스크롤하며 채운 뒤 앞 페이지분은 건너뜀
+                await self._fill_cursor(cursor, skip + size)
+                cursor.pending = cursor.pending[skip:]
+                result = self._take_cursor_page(cursor, page, size)
+            except Exception as e:
+                logger.warning("Browser search error: %s", e, extra={"keyword": keyword})
+                await self._release_page(browser_page)
+                raise e
+            
+            if result["hasMore"]:
+                # 다음 페이지 요청을 위해 커서 유지 (같은 키의 이전 커서는 교체)
+                if key in self._cursors:
+                    await self._drop_cursor(key)
+                self._cursors[key] = cursor
+            else:
+                await self._release_page(browser_page)
+        
+        logger.debug("Browser search found products", extra={"products": len(result["products"]), "page": page})
+        return result
+    
+    def _add_cursor_products(self, cursor: ScrollCursor, products: List[Dict]) -> int:
+        """처음 보는 상품만 커서 대기열에 추가하고 추가된 개수 반환"""
+        added = 0
+        for product in products:
+            product_id = product.get("id")
+            if not product_id or product_id in cursor.seen_ids:
+                continue
+            cursor.seen_ids.add(product_id)
+            cursor.pending.append(product)
+            added += 1
+        return added
+    
+    async def _fill_cursor(self, cursor: ScrollCursor, needed: int, max_stalls: int = 2):
+        """대기열이 needed개가 될 때까지 더 스크롤하며 새로 나타난 상품 수집"""
+        stalls = 0
+        while len(cursor.pending) < needed and not cursor.exhausted:
+            await cursor.page.evaluate("""
+                async () => {
+                    window.scrollTo(0, document.body.scrollHeight);
+                    await new Promise(r => setTimeout(r, 1000));
                 }
             """)
-            
-            # 이미지 로드 대기
-            await browser_page.wait_for_timeout(2000)
-            
-            # __NEXT_DATA__ 또는 __NUXT_DATA__에서 데이터 추출
-            products = await self._extract_products_from_page(browser_page, size)
-            
-            if not products:
-                print("No products found in page data, trying DOM extraction")
-                products = await self._extract_products_from_dom(browser_page, size)
-            
-            print(f"Found {len(products)} products")
-            
-            return {
-                "products": products,
-                "total": len(products),
-                "hasMore": len(products) >= size
-            }
-            
-        except Exception as e:
-            print(f"Search error: {e}")
-            raise e
-        finally:
-            await browser_page.context.close()
+            dom_products = await self._extract_products_from_dom(cursor.page, len(cursor.seen_ids) + needed)
+            if self._add_cursor_products(cursor, dom_products):
+                stalls = 0
+            else:
+                stalls += 1
+                if stalls >= max_stalls:
+                    cursor.exhausted = True
+    
+    def _take_cursor_page(self, cursor: ScrollCursor, page: int, size: int) -> Dict[str, Any]:
+        """대기열에서 한 페이지 분량을 꺼내 응답 형식으로 반환"""
+        products = cursor.pending[:size]
+        cursor.pending = cursor.pending[size:]
+        cursor.next_page = page + 1
+        cursor.last_used = time.monotonic()
+        
+        return {
+            "products": products,
+            "total": len(cursor.seen_ids),
+            "hasMore": bool(cursor.pending) or (len(products) >= size and not cursor.exhausted)
+        }
 
     async def _search_via_api(
         self, 
@@ -173,15 +746,15 @@ class IdusScraper:
         encoded_keyword = urllib.parse.quote(keyword)
         
         # idus 검색 API 엔드포인트 (실제 브라우저가 사용하는 형식)
-        api_url = "https://www.idus.com/v2/www-api/search/products/v2"
+        api_url = f"{IDUS_BASE_URL}/v2/www-api/search/products/v2"
         
         headers = {
             "Accept": "application/json, text/plain, */*",
             "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
             "Content-Type": "application/json",
-            "Origin": "https://www.idus.com",
-            "Referer": f"https://www.idus.com/v2/search?keyword={encoded_keyword}",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Origin": IDUS_BASE_URL,
+            "Referer": f"{IDUS_BASE_URL}/v2/search?keyword={encoded_keyword}",
+            "User-Agent": USER_AGENT,
             "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
             "sec-ch-ua-mobile": "?0",
             "sec-ch-ua-platform": '"Windows"',
@@ -199,52 +772,53 @@ class IdusScraper:
             "categoryDepth3": None,
         }
         
-        print(f"Calling API with keyword: {keyword}")
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(api_url, headers=headers, json=payload, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                print(f"Search API response status: {response.status}")
+        session = await self.get_http_session()
+        async with session.post(api_url, headers=headers, json=payload, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status == 200:
+                data = await response.json()
+                products = []
                 
-                if response.status == 200:
-                    data = await response.json()
-                    products = []
-                    
-                    # 다양한 응답 구조 처리
-                    raw_products = (
-                        data.get("products") or 
-                        data.get("data", {}).get("products") or 
-                        data.get("result", {}).get("products") or
-                        data.get("items") or
-                        []
-                    )
-                    
-                    total_count = (
-                        data.get("totalCount") or 
-                        data.get("total") or 
-                        data.get("data", {}).get("totalCount") or
-                        len(raw_products)
+                # 다양한 응답 구조 처리
+                raw_products = (
+                    data.get("products") or 
+                    data.get("data", {}).get("products") or 
+                    data.get("result", {}).get("products") or
+                    data.get("items") or
+                    []
+                )
+                
+                total_count = (
+                    data.get("totalCount") or 
+                    data.get("total") or 
+                    data.get("data", {}).get("totalCount") or
+                    len(raw_products)
+                )
+                
+                for item in raw_products:
+                    product = self._normalize_api_product(item)
+                    if product:
+                        products.append(product)
+                
+                if products:
+                    debug_sampled(
+                        logger,
+                        "Search API sample product",
+                        keyword=keyword,
+                        rawProducts=len(raw_products),
+                        total=total_count,
+                        title=products[0].get("title"),
+                        image=products[0].get("image"),
                     )
-                    
-                    print(f"Raw products count: {len(raw_products)}, Total: {total_count}")
-                    
-                    for item in raw_products:
-                        product = self._normalize_api_product(item)
-                        if product:
-                            products.append(product)
-                    
-                    if products:
-                        print(f"✅ Sample product: {products[0].get('title', 'NO TITLE')[:30]}")
-                        print(f"   Image URL: {products[0].get('image', 'NO IMAGE')}")
-                    
-                    return {
-                        "products": products,
-                        "total": total_count,
-                        "hasMore": len(raw_products) >= size
-                    }
-                else:
-                    text = await response.text()
-                    print(f"API error response: {text[:500]}")
-                    raise Exception(f"API returned {response.status}")
+                
+                return {
+                    "products": products,
+                    "total": total_count,
+                    "hasMore": len(raw_products) >= size
+                }
+            else:
+                text = await response.text()
+                logger.warning("Search API error response", extra={"status": response.status, "body": text[:500]})
+                raise Exception(f"API returned {response.status}")
 
     def _normalize_api_product(self, item: dict) -> Optional[Dict]:
         """API 응답의 상품 데이터 정규화"""
@@ -287,7 +861,7 @@ class IdusScraper:
                 image_id = item.get(field)
                 # 타입 체크: 문자열이어야 함
                 if image_id and isinstance(image_id, str) and len(image_id) > 10:
-                    image_url = f"https://image.idus.com/image/files/{image_id}_400.jpg"
+                    image_url = f"{IDUS_IMAGE_BASE_URL}/image/files/{image_id}_400.jpg"
                     break
         
         # 3. 중첩 객체에서 이미지 찾기
@@ -315,7 +889,7 @@ class IdusScraper:
             if image_url.startswith("//"):
                 image_url = "https:" + image_url
             elif image_url.startswith("/"):
-                image_url = "https://www.idus.com" + image_url
+                image_url = IDUS_BASE_URL + image_url
         else:
             image_url = ""
         
@@ -360,7 +934,7 @@ class IdusScraper:
             "artistName": str(artist_name) if artist_name else "작가",
             "rating": safe_float(item.get("reviewAvg") or item.get("rating") or item.get("score") or item.get("reviewScore")),
             "reviewCount": safe_int(item.get("reviewCount") or item.get("reviewCnt") or item.get("reviewTotal")),
-            "url": f"https://www.idus.com/v2/product/{product_id}",
+            "url": f"{IDUS_BASE_URL}/v2/product/{product_id}",
             "category": item.get("categoryName") or item.get("category"),
         }
     
@@ -385,7 +959,7 @@ class IdusScraper:
             """)
             
             if next_data:
-                print("Found __NEXT_DATA__")
+                logger.debug("Found __NEXT_DATA__")
                 products = self._parse_next_data(next_data, size)
                 if products:
                     return products
@@ -406,11 +980,11 @@ class IdusScraper:
             """)
             
             if nuxt_data:
-                print("Found __NUXT_DATA__")
+                logger.debug("Found __NUXT_DATA__")
                 products = self._parse_nuxt_data(nuxt_data, size)
                 
         except Exception as e:
-            print(f"Error extracting page data: {e}")
+            logger.warning("Error extracting page data: %s", e)
         
         return products
     
@@ -462,7 +1036,7 @@ class IdusScraper:
                             return products
                             
         except Exception as e:
-            print(f"Error parsing __NEXT_DATA__: {e}")
+            logger.warning("Error parsing __NEXT_DATA__: %s", e)
         
         return products
     
@@ -523,9 +1097,7 @@ class IdusScraper:
                                         return products
                                         
         except Exception as e:
-            print(f"Error parsing __NUXT_DATA__: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("Error parsing __NUXT_DATA__: %s", e, exc_info=True)
         
         return products
     
@@ -573,7 +1145,7 @@ class IdusScraper:
             if image_url.startswith("//"):
                 image_url = "https:" + image_url
             elif image_url.startswith("/"):
-                image_url = "https://www.idus.com" + image_url
+                image_url = IDUS_BASE_URL + image_url
         else:
             image_url = ""
         
@@ -613,7 +1185,7 @@ class IdusScraper:
             "artistName": str(artist_name) if artist_name else "작가",
             "rating": safe_float(item.get("reviewAvg") or item.get("rating") or item.get("score")),
             "reviewCount": safe_int(item.get("reviewCount") or item.get("reviewCnt")),
-            "url": item.get("url") or f"https://www.idus.com/w/product/{product_id}",
+            "url": item.get("url") or f"{IDUS_BASE_URL}/w/product/{product_id}",
             "category": item.get("categoryName") or item.get("category"),
         }
     
@@ -623,203 +1195,48 @@ class IdusScraper:
         
         try:
             # idus v2 검색 결과의 상품 링크 - href에 /v2/product/ 또는 /w/product/ 포함
-            product_links = await page.evaluate("""
-                () => {
-                    const products = [];
-                    // 모든 상품 링크 찾기
-                    const links = document.querySelectorAll('a[href*="/v2/product/"], a[href*="/w/product/"]');
-                    
-                    for (const link of links) {
-                        try {
-                            const href = link.getAttribute('href') || '';
-                            
-                            // 상품 ID 추출
-                            const match = href.match(/\\/(?:v2|w)\\/product\\/([a-f0-9-]+)/i);
-                            if (!match) continue;
-                            const productId = match[1];
-                            
-                            // 이미 추가된 상품인지 확인
-                            if (products.some(p => p.id === productId)) continue;
-                            
-                            // 이미지 URL 추출 (다양한 속성 확인)
-                            const img = link.querySelector('img');
-                            let imageUrl = '';
-                            if (img) {
-                                // 우선순위: src > data-src > srcset > data-lazy > style background
-                                imageUrl = img.src || '';
-                                
-                                // src가 base64나 placeholder면 다른 속성 확인
-                                if (!imageUrl || imageUrl.includes('data:') || imageUrl.includes('placeholder') || imageUrl.length < 20) {
-                                    imageUrl = img.dataset.src || img.getAttribute('data-src') || '';
-                                }
-                                
-                                if (!imageUrl) {
-                                    imageUrl = img.getAttribute('data-lazy') || img.getAttribute('data-original') || '';
-                                }
-                                
-                                // srcset에서 추출
-                                if (!imageUrl && img.srcset) {
-                                    const srcsetParts = img.srcset.split(',')[0];
-                                    if (srcsetParts) {
-                                        imageUrl = srcsetParts.trim().split(' ')[0];
-                                    }
-                                }
-                                
-                                // 배경 이미지 확인
-                                if (!imageUrl) {
-                                    const style = img.style.backgroundImage;
-                                    if (style) {
-                                        const match = style.match(/url\\(['"]?([^'"\\)]+)['"]?\\)/);
-                                        if (match) imageUrl = match[1];
-                                    }
-                                }
-                            }
-                            
-                            // 이미지가 없으면 부모에서 찾기
-                            if (!imageUrl) {
-                                const parentImg = link.closest('div')?.querySelector('img');
-                                if (parentImg) {
-                                    imageUrl = parentImg.src || parentImg.dataset.src || '';
-                                }
-                            }
-                            
-                            // URL 정규화
-                            if (imageUrl) {
-                                if (imageUrl.startsWith('//')) {
-                                    imageUrl = 'https:' + imageUrl;
-                                } else if (imageUrl.startsWith('/')) {
-                                    imageUrl = 'https://www.idus.com' + imageUrl;
-                                }
-                                // base64나 placeholder 제거
-                                if (imageUrl.includes('data:') || imageUrl.includes('placeholder') || imageUrl.length < 30) {
-                                    imageUrl = '';
-                                }
-                            }
-                            
-                            // 링크의 전체 텍스트에서 정보 추출
-                            const fullText = link.innerText || link.textContent || '';
-                            
-                            // 가격 추출 (숫자,숫자 원 또는 숫자원 패턴)
-                            const priceMatches = fullText.match(/([0-9,]+)\\s*원/g) || [];
-                            let price = 0;
-                            let originalPrice = null;
-                            
-                            if (priceMatches.length > 0) {
-                                // 첫 번째 가격 (원가 또는 할인가)
-                                const firstPrice = parseInt(priceMatches[0].replace(/[^0-9]/g, '')) || 0;
-                                
-                                if (priceMatches.length >= 2) {
-                                    // 두 번째 가격이 있으면 첫 번째가 원가, 두 번째가 할인가
-                                    originalPrice = firstPrice;
-                                    price = parseInt(priceMatches[1].replace(/[^0-9]/g, '')) || firstPrice;
-                                } else {
-                                    price = firstPrice;
-                                }
-                            }
-                            
-                            // 평점 추출 (4.8, 5.0 등의 패턴)
-                            const ratingMatch = fullText.match(/([0-5]\\.[0-9])\\s*\\(([0-9,]+)\\)/);
-                            const rating = ratingMatch ? parseFloat(ratingMatch[1]) : 0;
-                            const reviewCount = ratingMatch ? parseInt(ratingMatch[2].replace(/,/g, '')) : 0;
-                            
-                            // 할인율 추출
-                            const discountMatch = fullText.match(/([0-9]+)%/);
-                            const discountRate = discountMatch ? parseInt(discountMatch[1]) : null;
-                            
-                            // 텍스트 분석하여 작가명과 상품명 분리
-                            // 패턴: "작가명 상품명 가격원..."
-                            const lines = fullText.split('\\n').map(l => l.trim()).filter(l => l);
-                            
-                            let artistName = '작가';
-                            let title = '';
-                            
-                            // 첫 번째 줄이 작가명인 경우가 많음
-                            if (lines.length >= 2) {
-                                // 첫 번째 줄에 "원"이나 숫자가 많으면 작가명+상품명 혼합
-                                const firstLine = lines[0];
-                                if (!/[0-9,]+\\s*원/.test(firstLine) && firstLine.length < 30) {
-                                    artistName = firstLine;
-                                    // 두 번째 줄부터 상품명 찾기
-                                    for (let i = 1; i < lines.length; i++) {
-                                        if (!/[0-9,]+\\s*원/.test(lines[i]) && !lines[i].includes('%') && lines[i].length > 5) {
-                                            title = lines[i];
-                                            break;
-                                        }
-                                    }
-                                } else {
-                                    // 첫 줄에서 분리 시도 (예: "소소페인팅 밤하늘의 펄 물감폰케이스")
-                                    const parts = firstLine.split(/\\s+/);
-                                    if (parts.length >= 2) {
-                                        artistName = parts[0];
-                                        title = parts.slice(1).join(' ');
-                                    }
-                                }
-                            }
-                            
-                            // 상품명이 비어있으면 전체 텍스트에서 추출
-                            if (!title) {
-                                // 가격, 평점 등 제거하고 상품명 추출
-                                title = fullText
-                                    .replace(/[0-9,]+\\s*원/g, '')
-                                    .replace(/[0-9]+%/g, '')
-                                    .replace(/[0-5]\\.[0-9]\\s*\\([0-9,]+\\)/g, '')
-                                    .replace(/멤버십.*할인/g, '')
-                                    .replace(/쿠폰/g, '')
-                                    .replace(/후기.*/g, '')
-                                    .replace(/살수록할인/g, '')
-                                    .trim()
-                                    .split('\\n')[0]
-                                    .trim();
-                                
-                                // 너무 길면 자르기
-                                if (title.length > 100) {
-                                    title = title.substring(0, 100);
-                                }
-                            }
-                            
-                            if (!title || title.length < 2) {
-                                title = `상품 ${products.length + 1}`;
-                            }
-                            
-                            products.push({
-                                id: productId,
-                                title: title,
-                                price: price,
-                                originalPrice: originalPrice,
-                                discountRate: discountRate,
-                                image: imageUrl,
-                                artistName: artistName,
-                                rating: rating,
-                                reviewCount: reviewCount,
-                                url: 'https://www.idus.com/v2/product/' + productId,
-                            });
-                            
-                        } catch (e) {
-                            console.error('Error parsing product:', e);
-                        }
-                    }
-                    
-                    return products;
-                }
-            """)
+            product_links = await page.evaluate(DOM_PRODUCTS_SCRIPT, IDUS_BASE_URL)
             
             if product_links:
-                print(f"DOM extraction found {len(product_links)} products")
+                logger.debug("DOM extraction found products", extra={"products": len(product_links)})
                 products = product_links[:size]
+                for product in products:
+                    product[DOM_EXTRACTED] = True
                 
         except Exception as e:
-            print(f"DOM extraction error: {e}")
+            logger.warning("DOM extraction error: %s", e)
         
         return products
     
-    async def get_product_detail(self, url: str) -> Dict:
-        """상품 상세 정보 가져오기"""
+    async def get_product_detail(self, url: str, background: bool = False) -> Dict:
+        """
+        상품 상세 정보 가져오기 - 서버 HTML 우선, 실패 시 브라우저 크롤링
+        background: 예산을 try_acquire로 이미 받은 백그라운드 요청 (예산을 다시 소모하지 않고 브라우저 대체 없음)
+        """
+        if not background:
+            self.upstream_budget.consume()
+        
+        # 1. 서버 HTML의 __NEXT_DATA__ / JSON-LD 직접 파싱 (브라우저 없이 1회 왕복)
+        try:
+            result = await self._get_product_detail_via_http(url)
+            if result:
+                debug_sampled(logger, "HTML method succeeded", url=url)
+                self.stats["detail_http"] += 1
+                return result
+            logger.info("No product data in HTML, falling back to browser", extra={"url": url})
+        except Exception as e:
+            logger.warning("HTML method failed: %s", e, extra={"url": url})
+        
+        # 2. 실패 시 브라우저 크롤링 (사용자 요청만 - 선행 수집이 브라우저 페이지 슬롯을 차지하지 않도록)
+        if background:
+            raise BackgroundFetchFailed("HTML 상세 수집 실패 (백그라운드 요청은 브라우저를 사용하지 않음)")
+        self.stats["detail_browser"] += 1
         await self.initialize()
         
-        browser_page = await self._create_stealth_page()
+        browser_page = await self._acquire_page()
         
         try:
-            print(f"Getting product detail: {url}")
+            logger.debug("Getting product detail via browser", extra={"url": url})
             
             await browser_page.goto(url, wait_until="domcontentloaded", timeout=30000)
             await browser_page.wait_for_timeout(2000)
@@ -852,58 +1269,12 @@ class IdusScraper:
             """)
             
             if product_data:
-                # JSON-LD 형식
-                if "@type" in product_data:
-                    return {
-                        "id": product_data.get("productID") or url.split("/")[-1],
-                        "title": product_data.get("name", ""),
-                        "price": int(float(product_data.get("offers", {}).get("price", 0))),
-                        "image": product_data.get("image", [""])[0] if isinstance(product_data.get("image"), list) else product_data.get("image", ""),
-                        "artistName": product_data.get("brand", {}).get("name", "작가"),
-                        "rating": float(product_data.get("aggregateRating", {}).get("ratingValue", 0)),
-                        "reviewCount": int(product_data.get("aggregateRating", {}).get("reviewCount", 0)),
-                        "url": url,
-                        "description": product_data.get("description", ""),
-                        "additionalImages": product_data.get("image", []) if isinstance(product_data.get("image"), list) else [],
-                    }
-                
-                # idus 내부 형식
-                additional_images = []
-                if "images" in product_data and isinstance(product_data["images"], list):
-                    for img in product_data["images"]:
-                        img_url = img.get("url") or img.get("imageUrl") or (img if isinstance(img, str) else "")
-                        if img_url:
-                            additional_images.append(img_url)
-                
-                tags = []
-                if "tags" in product_data and isinstance(product_data["tags"], list):
-                    for tag in product_data["tags"]:
-                        if isinstance(tag, str):
-                            tags.append(tag)
-                        elif isinstance(tag, dict) and "name" in tag:
-                            tags.append(tag["name"])
-                
-                return {
-                    "id": product_data.get("uuid") or url.split("/")[-1],
-                    "title": product_data.get("name", ""),
-                    "price": product_data.get("price", 0),
-                    "originalPrice": product_data.get("originPrice"),
-                    "discountRate": product_data.get("discountRate"),
-                    "image": product_data.get("imageUrl") or (additional_images[0] if additional_images else ""),
-                    "artistName": product_data.get("artistName") or product_data.get("artist", {}).get("name", "작가"),
-                    "rating": float(product_data.get("reviewAvg", 0)),
-                    "reviewCount": int(product_data.get("reviewCount", 0)),
-                    "url": url,
-                    "description": product_data.get("description", ""),
-                    "additionalImages": additional_images,
-                    "options": product_data.get("options", []),
-                    "tags": tags,
-                }
+                return self._map_product_detail(product_data, url)
             
             # 데이터를 찾지 못한 경우 기본값 반환
             return {
                 "id": url.split("/")[-1],
-                "title": "상품 정보를 가져올 수 없습니다",
+                "title": DETAIL_UNAVAILABLE_TITLE,
                 "price": 0,
                 "image": "",
                 "artistName": "작가",
@@ -913,7 +1284,78 @@ class IdusScraper:
             }
             
         except Exception as e:
-            print(f"Product detail error: {e}")
+            logger.warning("Browser product detail error: %s", e, extra={"url": url})
             raise e
         finally:
-            await browser_page.context.close()
+            await self._release_page(browser_page)
+    
+    async def _get_product_detail_via_http(self, url: str) -> Optional[Dict]:
+        """
+        공유 HTTP 세션으로 상품 페이지 HTML을 받아 스크립트 데이터만 스트리밍 파싱
+        상품 데이터를 찾지 못하면 None
+        """
+        headers = {
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+            "User-Agent": USER_AGENT,
+        }
+        
+        session = await self.get_http_session()
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status != 200:
+                raise Exception(f"Detail HTML returned {response.status}")
+            product_data = await read_detail_payload(response)
+        
+        if not product_data:
+            return None
+        return self._map_product_detail(product_data, url)
+    
+    def _map_product_detail(self, product_data: dict, url: str) -> Dict:
+        """상세 데이터(JSON-LD 또는 idus 내부 형식)를 응답 형식으로 변환"""
+        # JSON-LD 형식
+        if "@type" in product_data:
+            return {
+                "id": product_data.get("productID") or url.split("/")[-1],
+                "title": product_data.get("name", ""),
+                "price": int(float(product_data.get("offers", {}).get("price", 0))),
+                "image": product_data.get("image", [""])[0] if isinstance(product_data.get("image"), list) else product_data.get("image", ""),
+                "artistName": product_data.get("brand", {}).get("name", "작가"),
+                "rating": float(product_data.get("aggregateRating", {}).get("ratingValue", 0)),
+                "reviewCount": int(product_data.get("aggregateRating", {}).get("reviewCount", 0)),
+                "url": url,
+                "description": product_data.get("description", ""),
+                "additionalImages": product_data.get("image", []) if isinstance(product_data.get("image"), list) else [],
+            }
+        
+        # idus 내부 형식
+        additional_images = []
+        if "images" in product_data and isinstance(product_data["images"], list):
+            for img in product_data["images"]:
+                img_url = img.get("url") or img.get("imageUrl") or (img if isinstance(img, str) else "")
+                if img_url:
+                    additional_images.append(img_url)
+        
+        tags = []
+        if "tags" in product_data and isinstance(product_data["tags"], list):
+            for tag in product_data["tags"]:
+                if isinstance(tag, str):
+                    tags.append(tag)
+                elif isinstance(tag, dict) and "name" in tag:
+                    tags.append(tag["name"])
+        
+        return {
+            "id": product_data.get("uuid") or url.split("/")[-1],
+            "title": product_data.get("name", ""),
+            "price": product_data.get("price", 0),
+            "originalPrice": product_data.get("originPrice"),
+            "discountRate": product_data.get("discountRate"),
+            "image": product_data.get("imageUrl") or (additional_images[0] if additional_images else ""),
+            "artistName": product_data.get("artistName") or product_data.get("artist", {}).get("name", "작가"),
+            "rating": float(product_data.get("reviewAvg", 0)),
+            "reviewCount": int(product_data.get("reviewCount", 0)),
+            "url": url,
+            "description": product_data.get("description", ""),
+            "additionalImages": additional_images,
+            "options": product_data.get("options", []),
+            "tags": tags,
+        }
@@ -0,0 +1,190 @@
+"""
+인기 키워드 캐시 워밍
+검색된 (keyword, sort)를 감쇠 LFU로 집계하고, 한가한 시간에 상위 K개의 첫 페이지를 업스트림 예산 안에서 미리 갱신
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from .ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+WARM_ENABLED = os.environ.get("WARM_ENABLED", "0") == "1"
+WARM_TOP_K = int(os.environ.get("WARM_TOP_K", "20"))
+# 인기도 반감기 (초)
+WARM_HALF_LIFE = float(os.environ.get("WARM_HALF_LIFE", "3600"))
+# 워밍 대상이 되는 최소 인기도 (감쇠된 검색 횟수, 기본값은 반감기 안에 두 번 이상 검색) - 한 번 검색되고 잊힌 키는 제외
+WARM_MIN_SCORE = float(os.environ.get("WARM_MIN_SCORE", "1.5"))
+# 이 점수 아래로 감쇠한 키는 집계에서 삭제
+WARM_DROP_SCORE = 0.05
+# 워밍 주기와 한가함 판단 기준 (마지막 사용자 검색 후 경과 초)
+WARM_INTERVAL = float(os.environ.get("WARM_INTERVAL", "30"))
+WARM_IDLE_SECONDS = float(os.environ.get("WARM_IDLE_SECONDS", "5"))
+# 남은 TTL이 이 비율 미만이면 갱신 대상
+WARM_REFRESH_RATIO = float(os.environ.get("WARM_REFRESH_RATIO", "0.3"))
+# 쉼표로 구분한 시즌 키워드 (sort는 popular)
+WARM_SEED_KEYWORDS = os.environ.get("WARM_SEED_KEYWORDS", "")
+# 집계 키 최대 개수
+WARM_MAX_TRACKED = 5000
+# 시간대별 통계 보관 개수 (1시간 단위, 24시간)
+STATS_BUCKET_SECONDS = 3600
+STATS_BUCKETS = 24
+
+WarmKey = Tuple[str, str]
+
+
+class CacheWarmer:
+    def __init__(
+        self,
+        refresh: Callable[[str, str], Awaitable[None]],
+        remaining_ttl: Callable[[str, str], Optional[float]],
+        ttl: float,
+        budget: TokenBucket,
+        top_k: int = WARM_TOP_K,
+        seeds: Optional[List[str]] = None,
+    ):
+        self._refresh = refresh
+        self._remaining_ttl = remaining_ttl
+        self._ttl = ttl
+        self._budget = budget
+        self.top_k = top_k
+        self._decay = math.log(2) / WARM_HALF_LIFE
+        # (keyword, sort) -> (점수, 마지막 갱신 시각)
+        self._scores: Dict[WarmKey, Tuple[float, float]] = {}
+        # 시즌 키워드는 점수가 감쇠해도 항상 워밍 대상
+        self._seeds = {(keyword, "popular") for keyword in seeds or []}
+        # 워머가 채운 뒤 아직 사용자 요청으로 덮어쓰이지 않은 키
+        self._warmed: set = set()
+        self._last_activity = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self.refreshed = 0
+        self.skipped_budget = 0
+        # [버킷 시작 시각, 요청 수, 캐시 히트, 워밍 히트]
+        self._buckets: Deque[List[float]] = deque(maxlen=STATS_BUCKETS)
+
+        for key in self._seeds:
+            self._bump(key, time.time(), weight=1.0)
+
+    def _score(self, key: WarmKey, now: float) -> float:
+        score, updated = self._scores.get(key, (0.0, now))
+        return score * math.exp(-self._decay * (now - updated))
+    
+    def _eligible(self, key: WarmKey, score: float) -> bool:
+        return score >= WARM_MIN_SCORE or key in self._seeds
+    
+    def _prune(self, now: float):
+        """충분히 감쇠한 키 삭제 (시즌 키워드 제외)"""
+        for key in [k for k in self._scores if k not in self._seeds and self._score(k, now) < WARM_DROP_SCORE]:
+            del self._scores[key]
+            self._warmed.discard(key)
+
+    def _bump(self, key: WarmKey, now: float, weight: float = 1.0):
+        self._scores[key] = (self._score(key, now) + weight, now)
+        if len(self._scores) > WARM_MAX_TRACKED:
+            # 점수가 가장 낮은 10%를 한 번에 정리
+            ranked = sorted(self._scores, key=lambda k: self._score(k, now))
+            for stale in ranked[:WARM_MAX_TRACKED // 10]:
+                del self._scores[stale]
+                self._warmed.discard(stale)
+
+    def record(self, keyword: str, sort: str, cache_hit: bool, warmed_key: bool):
+        """사용자 검색 기록 (warmed_key: 워밍된 첫 페이지 캐시 키에 대한 요청인지)"""
+        now = time.time()
+        key = (keyword, sort)
+        self._bump(key, now)
+        self._last_activity = time.monotonic()
+
+        bucket_start = now - now % STATS_BUCKET_SECONDS
+        if not self._buckets or self._buckets[-1][0] != bucket_start:
+            self._buckets.append([bucket_start, 0, 0, 0])
+        bucket = self._buckets[-1]
+        bucket[1] += 1
+        if cache_hit:
+            bucket[2] += 1
+            if warmed_key and key in self._warmed:
+                bucket[3] += 1
+        elif warmed_key:
+            # 사용자 요청으로 새로 채워진 항목은 더 이상 워밍 결과가 아님
+            self._warmed.discard(key)
+
+    def top(self, k: Optional[int] = None) -> List[Tuple[WarmKey, float]]:
+        """워밍 대상 상위 키 (최소 인기도 미만 제외)"""
+        now = time.time()
+        scored = ((key, self._score(key, now)) for key in self._scores)
+        ranked = sorted((item for item in scored if self._eligible(*item)), key=lambda item: item[1], reverse=True)
+        return ranked[:k or self.top_k]
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(WARM_INTERVAL)
+            try:
+                await self.warm_once()
+            except Exception:
+                logger.exception("Cache warm error")
+
+    async def warm_once(self) -> int:
+        """한가할 때 상위 K개 중 만료 임박/없는 항목 갱신, 갱신한 개수 반환"""
+        refreshed = 0
+        self._prune(time.time())
+        for key, _ in self.top():
+            if time.monotonic() - self._last_activity < WARM_IDLE_SECONDS:
+                # 사용자 트래픽이 다시 들어오면 중단
+                break
+            remaining = self._remaining_ttl(*key)
+            if remaining is not None and remaining > self._ttl * WARM_REFRESH_RATIO:
+                continue
+            # 버스트의 절반은 사용자 요청 몫으로 남겨둠 (refresh는 예산을 다시 소모하지 않음)
+            if not self._budget.try_acquire(reserve=self._budget.burst / 2):
+                self.skipped_budget += 1
+                break
+            try:
+                await self._refresh(*key)
+            except Exception as e:
+                logger.warning("Cache warm failed: %s", e, extra={"keyword": key[0], "sort": key[1]})
+                continue
+            self._warmed.add(key)
+            refreshed += 1
+            self.refreshed += 1
+        if refreshed:
+            logger.info("Cache warmer refreshed keys", extra={"refreshed": refreshed})
+        return refreshed
+
+    def stats(self) -> Dict:
+        buckets = [
+            {
+                "hourStart": int(start),
+                "requests": int(requests),
+                "hitRate": round(hits / requests, 3) if requests else None,
+                "warmHitRate": round(warm_hits / requests, 3) if requests else None,
+            }
+            for start, requests, hits, warm_hits in self._buckets
+        ]
+        peak = max(buckets, key=lambda b: b["requests"], default=None)
+        return {
+            "enabled": self._task is not None,
+            "tracked": len(self._scores),
+            "refreshed": self.refreshed,
+            "skippedForBudget": self.skipped_budget,
+            "top": [{"keyword": k, "sort": s, "score": round(score, 2)} for (k, s), score in self.top()],
+            "peakHour": peak,
+            "hourly": buckets,
+        }
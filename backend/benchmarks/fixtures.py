@@ -0,0 +1,55 @@
+"""
+벤치마크용 fixture 로더
+fixtures/ 의 파일은 실제 idus 응답 구조를 익명화한 것 (상품명/작가명/ID/이미지 ID 치환)
+"""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any, List
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_json(name: str) -> Any:
+    with open(FIXTURES_DIR / name, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_text(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def api_products() -> List[dict]:
+    """검색 API 응답의 상품 배열 (필드명 변형 포함)"""
+    return load_json("api_search.json")["data"]["products"]
+
+
+def next_data() -> dict:
+    """검색 페이지 __NEXT_DATA__"""
+    return load_json("next_data_search.json")
+
+
+def nuxt_data(scale: int = 1) -> list:
+    """
+    검색 페이지 __NUXT_DATA__ 배열
+    scale > 1이면 상품 객체를 복제해 ID만 바꿔 크기를 늘림 (참조형 객체 비율 유지)
+    """
+    base = load_json("nuxt_data_search.json")
+    if scale <= 1:
+        return base
+    
+    payload = list(base)
+    for n in range(1, scale):
+        for item in base:
+            if isinstance(item, dict) and isinstance(item.get("uuid"), str):
+                clone = copy.copy(item)
+                clone["uuid"] = f"{item['uuid'][:-6]}{n:06d}"
+                payload.append(clone)
+            elif isinstance(item, dict) and isinstance(item.get("uuid"), int):
+                payload.append(dict(item))
+    return payload
+
+
+def fixture_path(name: str) -> Path:
+    return FIXTURES_DIR / name
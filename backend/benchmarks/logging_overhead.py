@@ -0,0 +1,92 @@
+"""
+검색 요청 경로의 로그 출력 비용 (이벤트 루프 스레드 기준)
+
+backend 디렉토리에서 실행:
+    python -m benchmarks.logging_overhead
+
+API 검색 1회가 남기던 print 6줄(before)과 같은 내용을 app.log 구성으로 남길 때(after)의 호출 스레드 비용을 비교
+출력은 파이프로 보내고 별도 스레드가 읽어서 버림 (컨테이너 stdout과 같은 조건)
+- before: print (버퍼링) / print(flush=True)
+- after: LOG_LEVEL=INFO (디버그 로그는 레벨 검사에서 종료), LOG_LEVEL=DEBUG + 샘플링, LOG_LEVEL=DEBUG 샘플링 없음
+"""
+
+import io
+import logging
+import os
+import statistics
+import threading
+import timeit
+
+from app import log
+
+PRODUCT_TITLE = "반지 수제 원목 은반지 커플링 024"
+IMAGE_URL = "https://image.idus.com/image/files/2376ced28e46a18586d3b992a93265a5a6e61c642376_400.jpg"
+
+
+def pipe_stream() -> io.TextIOWrapper:
+    """읽는 쪽을 스레드로 비워두는 파이프 (컨테이너 로그 수집기 역할)"""
+    read_fd, write_fd = os.pipe()
+
+    def drain():
+        with os.fdopen(read_fd, "rb") as reader:
+            while reader.read(65536):
+                pass
+
+    threading.Thread(target=drain, daemon=True).start()
+    return io.TextIOWrapper(os.fdopen(write_fd, "wb"), encoding="utf-8")
+
+
+def print_lines(stream, flush: bool):
+    print("Calling API with keyword: 반지", file=stream, flush=flush)
+    print("Search API response status: 200", file=stream, flush=flush)
+    print("Raw products count: 24, Total: 600", file=stream, flush=flush)
+    print(f"✅ Sample product: {PRODUCT_TITLE[:30]}", file=stream, flush=flush)
+    print(f"   Image URL: {IMAGE_URL}", file=stream, flush=flush)
+    print("API method succeeded: 24 products", file=stream, flush=flush)
+
+
+def log_lines(logger: logging.Logger):
+    log.debug_sampled(
+        logger, "Search API sample product",
+        keyword="반지", rawProducts=24, total=600, title=PRODUCT_TITLE, image=IMAGE_URL,
+    )
+    log.debug_sampled(logger, "API method succeeded", products=24)
+
+
+def bench(fn, repeat: int = 5) -> float:
+    """1회당 µs (median)"""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return statistics.median(t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number))
+
+
+def main():
+    stream = pipe_stream()
+    results = {
+        "before: print x6": bench(lambda: print_lines(stream, flush=False)),
+        "before: print x6 (flush)": bench(lambda: print_lines(stream, flush=True)),
+    }
+
+    log.LOG_SAMPLE_RATE = 0.05
+    for level in ("INFO", "DEBUG"):
+        log.LOG_LEVEL = level
+        logger = log.setup_logging(stream)
+        child = logging.getLogger(f"{log.APP_LOGGER}.bench")
+        token = log.request_id_var.set("bench")
+        results[f"after: LOG_LEVEL={level}, sample 5%"] = bench(lambda: log_lines(child))
+        log.request_id_var.reset(token)
+        log.shutdown_logging()
+
+    log.LOG_SAMPLE_RATE = 1.0
+    logger = log.setup_logging(stream)
+    logger.setLevel("DEBUG")
+    child = logging.getLogger(f"{log.APP_LOGGER}.bench")
+    results["after: LOG_LEVEL=DEBUG, no sampling"] = bench(lambda: log_lines(child))
+    log.shutdown_logging()
+
+    for name, micros in results.items():
+        print(f"{name:<40} {micros:>8.2f} µs / search")
+
+
+if __name__ == "__main__":
+    main()
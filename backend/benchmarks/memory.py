@@ -0,0 +1,67 @@
+"""
+상품 메모리 사용량 비교 (dict vs 압축 행)
+
+backend 디렉토리에서 실행:
+    python -m benchmarks.memory                 # 상품 1만 개
+    python -m benchmarks.memory --count 50000
+
+fixture 상품을 ID만 바꿔 복제한 뒤 JSON 왕복으로 문자열을 상품마다 새로 만들어 (API 응답 파싱과 같은 상태)
+tracemalloc으로 상품당 바이트와 Redis에 저장되는 직렬화 크기를 측정
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, Tuple
+
+import orjson
+
+from app.compact import pack_products, unpack_products
+from app.scraper import IdusScraper
+
+from . import fixtures
+
+
+def traced(build: Callable[[], object]) -> Tuple[object, int]:
+    """build 결과가 살아 있는 동안 늘어난 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return value, used
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상품 메모리 사용량 비교")
+    parser.add_argument("--count", type=int, default=10000, help="측정할 상품 수")
+    args = parser.parse_args()
+
+    scraper = IdusScraper()
+    normalized = [scraper._normalize_api_product(item) for item in fixtures.api_products()]
+    many = [
+        dict(product, id=f"{product['id']}-{i}", url=f"{product['url']}-{i}")
+        for i in range(args.count // len(normalized) + 1)
+        for product in normalized
+    ][:args.count]
+    payload = orjson.dumps(many)
+
+    dicts, dict_bytes = traced(lambda: orjson.loads(payload))
+    rows, row_bytes = traced(lambda: pack_products(orjson.loads(payload)))
+    assert unpack_products(rows) == dicts
+
+    dict_wire = len(orjson.dumps(dicts))
+    row_wire = len(orjson.dumps(rows))
+    count = len(dicts)
+
+    print(f"products: {count}")
+    print(f"{'':<12}{'memory B/product':>18}{'serialized B/product':>24}")
+    print(f"{'dict':<12}{dict_bytes / count:>18.0f}{dict_wire / count:>24.0f}")
+    print(f"{'row':<12}{row_bytes / count:>18.0f}{row_wire / count:>24.0f}")
+    print(f"{'ratio':<12}{row_bytes / dict_bytes:>18.2f}{row_wire / dict_wire:>24.2f}")
+
+
+if __name__ == "__main__":
+    main()
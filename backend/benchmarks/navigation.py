@@ -0,0 +1,139 @@
+"""
+브라우저 내비게이션 벤치마크 (정적 리소스 캐시 cold/warm)
+
+backend 디렉토리에서 실행:
+    python -m benchmarks.navigation
+    python -m benchmarks.navigation --latency-ms 120 --bundles 8 --bundle-kb 300 --iterations 10
+
+가짜 idus 서버(loadtest.fake_idus)를 JS 번들을 포함하도록 띄우고, 요청마다 새 컨텍스트로
+검색 페이지 이동부터 __NEXT_DATA__를 읽을 수 있을 때까지의 시간을 측정
+- no-cache: 캐시 없음 (기존 동작)
+- cold: 빈 디스크 캐시
+- warm: 번들이 이미 저장된 디스크 캐시
+결과는 benchmarks/results/navigation-<시각>-<커밋>.json에 저장, Chromium이 없으면 종료 코드 1
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+from app.asset_cache import BrowserAssetCache
+from app.disk_cache import DiskLRUCache
+from benchmarks.run import RESULTS_DIR, git_revision
+from loadtest.fake_idus import FakeIdus
+
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+async def navigate(browser, url: str, asset_cache: Optional[BrowserAssetCache]) -> float:
+    """새 컨텍스트에서 이동 후 __NEXT_DATA__가 준비될 때까지 (ms)"""
+    context = await browser.new_context()
+    try:
+        if asset_cache:
+            await asset_cache.attach(context)
+        page = await context.new_page()
+        start = time.perf_counter()
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        await page.wait_for_function("() => !!document.getElementById('__NEXT_DATA__')")
+        return (time.perf_counter() - start) * 1000
+    finally:
+        await context.close()
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    return {"median_ms": statistics.median(timings), "best_ms": min(timings), "runs": len(timings)}
+
+
+async def run(args) -> Optional[Dict[str, Dict[str, float]]]:
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        print("playwright not installed")
+        return None
+
+    fake = FakeIdus(args.latency_ms, 0, 0, 0, 0, "next", args.bundles, args.bundle_kb)
+    runner = web.AppRunner(fake.build_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", args.port)
+    await site.start()
+    url = f"http://127.0.0.1:{args.port}/v2/search?keyword=향초"
+
+    playwright = await async_playwright().start()
+    try:
+        try:
+            browser = await playwright.chromium.launch(headless=True, args=["--no-sandbox"])
+        except Exception as e:
+            print(f"Chromium unavailable: {e}")
+            return None
+
+        results = {}
+        results["no-cache"] = summarize([await navigate(browser, url, None) for _ in range(args.iterations)])
+
+        cold = []
+        for _ in range(args.iterations):
+            with tempfile.TemporaryDirectory() as directory:
+                cold.append(await navigate(browser, url, BrowserAssetCache(DiskLRUCache(directory, CACHE_MAX_BYTES))))
+        results["cold"] = summarize(cold)
+
+        with tempfile.TemporaryDirectory() as directory:
+            warm_cache = BrowserAssetCache(DiskLRUCache(directory, CACHE_MAX_BYTES))
+            await navigate(browser, url, warm_cache)
+            results["warm"] = summarize([await navigate(browser, url, warm_cache) for _ in range(args.iterations)])
+            results["warm"]["cacheHits"] = warm_cache.hits
+
+        await browser.close()
+        return results
+    finally:
+        await playwright.stop()
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브라우저 내비게이션 cold/warm 캐시 벤치마크")
+    parser.add_argument("--port", type=int, default=9010)
+    parser.add_argument("--latency-ms", type=float, default=80, help="가짜 서버 응답 지연 (번들 포함)")
+    parser.add_argument("--bundles", type=int, default=6)
+    parser.add_argument("--bundle-kb", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본: benchmarks/results/navigation-<시각>-<커밋>.json)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if not results:
+        # 측정하지 못한 것을 통과로 오인하지 않도록 실패로 종료
+        sys.exit(1)
+    for name, result in results.items():
+        print(f"{name:<10} median {result['median_ms']:>8.1f} ms  best {result['best_ms']:>8.1f} ms")
+    baseline = results["no-cache"]["median_ms"]
+    for name in ("cold", "warm"):
+        print(f"{name} / no-cache median: {results[name]['median_ms'] / baseline:.2f}x")
+
+    revision = git_revision()
+    report = {
+        "meta": {
+            "revision": revision,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "latencyMs": args.latency_ms,
+            "bundles": args.bundles,
+            "bundleKb": args.bundle_kb,
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"navigation-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\nSaved: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+파서 마이크로 벤치마크 (오프라인, fixtures/ 사용)
+
+backend 디렉토리에서 실행:
+    python -m benchmarks.run                       # 결과를 benchmarks/results/ 에 저장
+    python -m benchmarks.run --compare OLD.json    # 이전 결과와 비교
+    python -m benchmarks.run --no-browser          # DOM 추출 스크립트 벤치마크 생략
+
+DOM 추출은 headless Chromium에서 로컬 search.html을 열어 DOM_PRODUCTS_SCRIPT를 실행하여 측정
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from app.analytics import ProductColumns, compute_price_stats
+from app.compact import pack_products
+from app.page_data import ScriptDataParser, product_from_next_data
+from app.scraper import IdusScraper, DOM_PRODUCTS_SCRIPT, IDUS_BASE_URL
+
+from . import fixtures
+
+RESULTS_DIR = Path(__file__).parent / "results"
+# 비교 시 이 비율 이상 느려지면 회귀로 표시
+REGRESSION_THRESHOLD = 1.10
+
+
+def bench(fn: Callable[[], object], repeat: int = 5) -> Dict[str, float]:
+    """timeit autorange로 반복 횟수를 정한 뒤 repeat회 측정 (1회당 µs)"""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    per_call = [t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best_us": min(per_call),
+        "median_us": statistics.median(per_call),
+    }
+
+
+def run_parser_benchmarks() -> Dict[str, Dict[str, float]]:
+    scraper = IdusScraper()
+    results = {}
+    
+    api_items = fixtures.api_products()
+    results[f"normalize_api_product[x{len(api_items)}]"] = bench(
+        lambda: [scraper._normalize_api_product(item) for item in api_items]
+    )
+    
+    next_data = fixtures.next_data()
+    raw_items = next_data["props"]["pageProps"]["dehydratedState"]["queries"][1]["state"]["data"]["pages"][0]["products"]
+    results[f"normalize_product[x{len(raw_items)}]"] = bench(
+        lambda: [scraper._normalize_product(item) for item in raw_items]
+    )
+    
+    results["parse_next_data[size=24]"] = bench(lambda: scraper._parse_next_data(next_data, 24))
+    results["parse_next_data[size=48]"] = bench(lambda: scraper._parse_next_data(next_data, 48))
+    
+    for scale in (1, 10, 50):
+        payload = fixtures.nuxt_data(scale)
+        count = sum(1 for item in payload if isinstance(item, dict) and isinstance(item.get("uuid"), str))
+        results[f"parse_nuxt_data[{len(payload)} items, size=24]"] = bench(lambda: scraper._parse_nuxt_data(payload, 24))
+        results[f"parse_nuxt_data[{len(payload)} items, size={count}]"] = bench(
+            lambda: scraper._parse_nuxt_data(payload, count), repeat=3
+        )
+    
+    detail_html = fixtures.load_text("detail.html")
+    
+    def stream_detail():
+        parser = ScriptDataParser()
+        for i in range(0, len(detail_html), 16384):
+            parser.feed(detail_html[i:i + 16384])
+            if parser.next_data is not None:
+                break
+        return product_from_next_data(parser.next_data)
+    
+    results["detail_html_stream_parse"] = bench(stream_detail)
+    
+    # 가격 분석: 정규화된 상품 5만 개 (fixture 상품 반복)
+    normalized = [scraper._normalize_api_product(item) for item in api_items]
+    many = [dict(product, id=f"{product['id']}-{i}") for i in range(50000 // len(normalized) + 1) for product in normalized][:50000]
+    results["analytics_columns[x50000]"] = bench(lambda: ProductColumns.from_products(many), repeat=3)
+    rows = pack_products(many)
+    results["analytics_columns_rows[x50000]"] = bench(lambda: ProductColumns.from_rows(rows), repeat=3)
+    columns = ProductColumns.from_products(many)
+    results["analytics_price_stats[x50000]"] = bench(lambda: compute_price_stats(columns), repeat=3)
+    return results
+
+
+async def run_dom_benchmark(iterations: int = 20) -> Optional[Dict[str, float]]:
+    """headless Chromium에서 로컬 검색 HTML에 DOM 추출 스크립트 실행"""
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        print("playwright not installed, skipping DOM benchmark")
+        return None
+    
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=True, args=["--no-sandbox"])
+    except Exception as e:
+        print(f"Chromium unavailable, skipping DOM benchmark: {e}")
+        await playwright.stop()
+        return None
+    
+    try:
+        page = await browser.new_page()
+        await page.goto(fixtures.fixture_path("search.html").resolve().as_uri())
+        products = await page.evaluate(DOM_PRODUCTS_SCRIPT, IDUS_BASE_URL)
+        
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await page.evaluate(DOM_PRODUCTS_SCRIPT, IDUS_BASE_URL)
+            timings.append((time.perf_counter() - start) * 1e6)
+        
+        return {
+            "number": 1,
+            "repeat": iterations,
+            "best_us": min(timings),
+            "median_us": statistics.median(timings),
+            "products": len(products),
+        }
+    finally:
+        await browser.close()
+        await playwright.stop()
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(current: Dict[str, Dict], baseline_path: Path) -> int:
+    """이전 결과와 median 비교, 회귀 개수 반환"""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    regressions = 0
+    print(f"\nCompared with {baseline_path}")
+    for name, result in current.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        ratio = result["median_us"] / old["median_us"]
+        mark = ""
+        if ratio >= REGRESSION_THRESHOLD:
+            mark = "  <-- regression"
+            regressions += 1
+        print(f"  {name:<50} {old['median_us']:>12.1f} -> {result['median_us']:>12.1f} µs  x{ratio:.2f}{mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="idus 파서 벤치마크")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본: benchmarks/results/<시각>-<커밋>.json)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--no-browser", action="store_true", help="DOM 추출 벤치마크 생략")
+    args = parser.parse_args()
+    
+    results = run_parser_benchmarks()
+    if not args.no_browser:
+        dom_result = asyncio.run(run_dom_benchmark())
+        if dom_result:
+            results[f"dom_extract_script[{dom_result['products']} cards]"] = dom_result
+    
+    for name, result in results.items():
+        print(f"{name:<50} median {result['median_us']:>12.1f} µs  best {result['best_us']:>12.1f} µs")
+    
+    revision = git_revision()
+    report = {
+        "meta": {
+            "revision": revision,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\nSaved: {output}")
+    
+    if args.compare:
+        regressions = compare(results, args.compare)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
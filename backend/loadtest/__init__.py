@@ -0,0 +1 @@
+# Load-test harness (fake idus server + load generator)
@@ -0,0 +1,214 @@
+"""
+로컬 가짜 idus 서버 (부하 테스트용)
+검색 API, 검색 HTML(__NEXT_DATA__ / __NUXT_DATA__), 상품 상세 HTML, 이미지, JS 번들을 흉내냄
+
+backend 디렉토리에서 실행:
+    python -m loadtest.fake_idus --port 9000 --latency-ms 80 --error-rate 0.02 --rps-limit 200
+
+스크래퍼를 이 서버로 향하게 하려면:
+    IDUS_BASE_URL=http://127.0.0.1:9000 IDUS_IMAGE_BASE_URL=http://127.0.0.1:9000 uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import hashlib
+import html
+import json
+import random
+import time
+from typing import Dict, List
+
+from aiohttp import web
+
+WORDS = ["가죽", "폰케이스", "머그컵", "도자기", "향초", "뜨개", "키링", "반지", "귀걸이", "목걸이",
+         "에코백", "파우치", "수제", "캔들", "드로잉", "엽서", "일러스트", "꽃", "자개", "원목"]
+ARTISTS = [f"작가{c}" for c in "가나다라마바사아자차"]
+CATEGORIES = ["디지털/폰케이스", "액세서리", "홈데코", "문구/팬시", "패션잡화", "주방/식기"]
+TOTAL_PER_KEYWORD = 600
+
+# 1x1 JPEG (이미지 프록시/브라우저 요청 응답용)
+TINY_JPEG = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb004300080606070605080707070909080a0c140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c20242e2720"
+    "222c231c1c2837292c30313434341f27393d38323c2e333432ffc0000b080001000101011100ffc4001f0000010501010101010100000000000000000102030405"
+    "060708090a0bffc400b5100002010303020403050504040000017d01020300041105122131410613516107227114328191a1082342b1c11552d1f02433627282090a"
+    "161718191a25262728292a3435363738393a434445464748494a535455565758595a636465666768696a737475767778797a838485868788898a92939495969798"
+    "999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5c6c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3f4f5f6f7f8f9faffda0008010100"
+    "003f00fbd0ffd9"
+)
+
+
+def make_product(keyword: str, index: int) -> Dict:
+    """키워드/순번으로 결정적인 가짜 상품 생성"""
+    digest = hashlib.sha1(f"{keyword}:{index}".encode()).hexdigest()
+    rnd = random.Random(digest)
+    price = rnd.randrange(8000, 90000, 500)
+    discount = rnd.choice([0, 0, 5, 10, 15, 20, 30])
+    uuid = f"{digest[:8]}-{digest[8:12]}-{digest[12:16]}-{digest[16:20]}-{digest[20:32]}"
+    return {
+        "uuid": uuid,
+        "name": f"{keyword} {' '.join(rnd.sample(WORDS, 2))} {index:03d}",
+        "price": price,
+        "originPrice": int(price / (1 - discount / 100)) if discount else price,
+        "discountRate": discount,
+        "imageId": digest + digest[:4],
+        "artistName": rnd.choice(ARTISTS),
+        "reviewAvg": round(rnd.uniform(3.8, 5.0), 1),
+        "reviewCount": rnd.randint(0, 2500),
+        "categoryName": rnd.choice(CATEGORIES),
+    }
+
+
+def product_page(keyword: str, page: int, size: int) -> List[Dict]:
+    start = (page - 1) * size
+    end = min(start + size, TOTAL_PER_KEYWORD)
+    return [make_product(keyword, i) for i in range(start, end)]
+
+
+class FakeIdus:
+    def __init__(self, latency_ms: float, jitter_ms: float, error_rate: float,
+                 api_error_rate: float, rps_limit: float, search_format: str,
+                 bundles: int = 0, bundle_kb: int = 150):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.api_error_rate = api_error_rate
+        self.rps_limit = rps_limit
+        self.search_format = search_format
+        self.bundles = bundles
+        self.bundle_body = ("/*" + "x" * max(0, bundle_kb * 1024 - 64) + "*/\nwindow.__bundles=(window.__bundles||0)+1;\n").encode()
+        self._tokens = rps_limit
+        self._last_refill = time.monotonic()
+        self.counts: Dict[str, int] = {}
+
+    @web.middleware
+    async def middleware(self, request: web.Request, handler):
+        route = request.match_info.route.name or "other"
+        self.counts[route] = self.counts.get(route, 0) + 1
+
+        if self.rps_limit > 0 and not self._take_token():
+            return web.Response(status=429, text="Too Many Requests", headers={"Retry-After": "1"})
+
+        delay = max(0.0, random.gauss(self.latency_ms, self.jitter_ms)) / 1000
+        if delay:
+            await asyncio.sleep(delay)
+
+        error_rate = self.api_error_rate if route == "search_api" else self.error_rate
+        if error_rate and random.random() < error_rate:
+            return web.Response(status=500, text="Internal Server Error")
+        return await handler(request)
+
+    def _take_token(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(self.rps_limit, self._tokens + (now - self._last_refill) * self.rps_limit)
+        self._last_refill = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def _bundle_tags(self) -> str:
+        """head의 동기 스크립트 번들 (파싱을 막으므로 domcontentloaded가 번들 수신 후에 발생)"""
+        return "".join(f'<script src="/_next/static/chunks/app-{i}.js"></script>' for i in range(self.bundles))
+
+    def _image_url(self, request: web.Request, image_id: str) -> str:
+        return f"{request.scheme}://{request.host}/image/files/{image_id}_400.jpg"
+
+    async def search_api(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        keyword = payload.get("keyword") or ""
+        page = int(payload.get("page") or 1)
+        size = int(payload.get("size") or 24)
+        products = product_page(keyword, page, size)
+        return web.json_response({"data": {"products": products, "totalCount": TOTAL_PER_KEYWORD}})
+
+    async def search_html(self, request: web.Request) -> web.Response:
+        keyword = request.query.get("keyword", "")
+        products = product_page(keyword, 1, 48)
+        for product in products:
+            product["imageUrl"] = self._image_url(request, product.pop("imageId"))
+
+        cards = "\n".join(
+            f'<div><a href="/v2/product/{p["uuid"]}"><img src="{p["imageUrl"]}">'
+            f'<div>{html.escape(p["artistName"])}</div><div>{html.escape(p["name"])}</div>'
+            f'<span>{p["price"]:,}원</span><span>{p["reviewAvg"]} ({p["reviewCount"]:,})</span></a></div>'
+            for p in products
+        )
+        if self.search_format == "nuxt":
+            script = f'<script type="application/json" id="__NUXT_DATA__">{json.dumps([{"total": TOTAL_PER_KEYWORD}] + products, ensure_ascii=False)}</script>'
+        else:
+            next_data = {"props": {"pageProps": {"dehydratedState": {"queries": [
+                {"state": {"data": {"pages": [{"products": products}]}}}
+            ]}}}}
+            script = f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data, ensure_ascii=False)}</script>'
+        body = f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">{self._bundle_tags()}</head><body><main>{cards}</main>{script}</body></html>'
+        return web.Response(text=body, content_type="text/html")
+
+    async def product_html(self, request: web.Request) -> web.Response:
+        product_id = request.match_info["product_id"]
+        rnd = random.Random(product_id)
+        product = make_product(product_id[:8], rnd.randint(0, TOTAL_PER_KEYWORD))
+        product["uuid"] = product_id
+        image_url = self._image_url(request, product.pop("imageId"))
+        product["images"] = [{"url": image_url}]
+        product["description"] = "손으로 만든 제품입니다. " * 20
+        product["tags"] = [{"name": "핸드메이드"}, "선물"]
+        json_ld = {
+            "@type": "Product", "productID": product_id, "name": product["name"], "image": [image_url],
+            "brand": {"name": product["artistName"]}, "offers": {"price": str(product["price"])},
+            "aggregateRating": {"ratingValue": product["reviewAvg"], "reviewCount": product["reviewCount"]},
+        }
+        filler = "<p>후기</p>" * 2000
+        body = (
+            f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">{self._bundle_tags()}'
+            f'<script type="application/ld+json">{json.dumps(json_ld, ensure_ascii=False)}</script></head>'
+            f'<body>{filler}<script id="__NEXT_DATA__" type="application/json">'
+            f'{json.dumps({"props": {"pageProps": {"product": product}}}, ensure_ascii=False)}</script></body></html>'
+        )
+        return web.Response(text=body, content_type="text/html")
+
+    async def image(self, request: web.Request) -> web.Response:
+        return web.Response(body=TINY_JPEG, content_type="image/jpeg", headers={"ETag": '"fake-image"'})
+
+    async def bundle(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.bundle_body,
+            content_type="application/javascript",
+            headers={"Cache-Control": "public, max-age=31536000, immutable"},
+        )
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.counts)
+
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self.middleware])
+        app.router.add_post("/v2/www-api/search/products/v2", self.search_api, name="search_api")
+        app.router.add_get("/v2/search", self.search_html, name="search_html")
+        app.router.add_get("/v2/product/{product_id}", self.product_html, name="product_html")
+        app.router.add_get("/w/product/{product_id}", self.product_html, name="product_html_w")
+        app.router.add_get("/image/files/{name}", self.image, name="image")
+        app.router.add_get("/_next/static/chunks/{name}", self.bundle, name="bundle")
+        app.router.add_get("/__stats", self.stats, name="stats")
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 idus 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=50, help="평균 응답 지연")
+    parser.add_argument("--jitter-ms", type=float, default=15, help="지연 표준편차")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (검색 API 제외)")
+    parser.add_argument("--api-error-rate", type=float, default=0.0, help="검색 API 500 응답 비율 (1이면 항상 브라우저 경로)")
+    parser.add_argument("--rps-limit", type=float, default=0, help="초당 허용 요청 수, 초과 시 429 (0이면 무제한)")
+    parser.add_argument("--search-format", choices=["next", "nuxt"], default="next", help="검색 HTML에 넣을 데이터 스크립트")
+    parser.add_argument("--bundles", type=int, default=0, help="HTML head에 넣을 JS 번들 개수")
+    parser.add_argument("--bundle-kb", type=int, default=150, help="JS 번들 하나의 크기(KB)")
+    args = parser.parse_args()
+
+    fake = FakeIdus(args.latency_ms, args.jitter_ms, args.error_rate, args.api_error_rate, args.rps_limit,
+                    args.search_format, args.bundles, args.bundle_kb)
+    web.run_app(fake.build_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
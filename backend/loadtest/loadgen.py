@@ -0,0 +1,160 @@
+"""
+크롤링 API 부하 생성기
+/api/search 와 /api/product/detail 에 목표 RPS로 요청을 보내고 처리량, p50/p95/p99, API/브라우저 경로 비율을 출력
+
+backend 디렉토리에서 실행:
+    python -m loadtest.loadgen --target http://127.0.0.1:8000 --rps 20 --duration 60 --detail-ratio 0.3
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import aiohttp
+
+DEFAULT_KEYWORDS = ["폰케이스", "머그컵", "향초", "귀걸이", "키링", "에코백", "도자기", "반지"]
+SORTS = ["popular", "newest", "price_asc", "price_desc", "rating"]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LoadGenerator:
+    def __init__(self, target: str, keywords: List[str], detail_ratio: float, max_page: int, timeout: float):
+        self.target = target.rstrip("/")
+        self.keywords = keywords
+        self.detail_ratio = detail_ratio
+        self.max_page = max_page
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.product_urls: List[str] = []
+
+    async def _request(self, session: aiohttp.ClientSession, endpoint: str, payload: dict):
+        start = time.perf_counter()
+        status = "error"
+        try:
+            async with session.post(f"{self.target}{endpoint}", json=payload, timeout=self.timeout) as response:
+                body = await response.read()
+                status = str(response.status)
+                if response.status == 200 and endpoint == "/api/search":
+                    products = json.loads(body).get("products", [])
+                    self.product_urls.extend(p["url"] for p in products[:5] if p.get("url"))
+                    del self.product_urls[:-500]
+        except asyncio.TimeoutError:
+            status = "timeout"
+        except aiohttp.ClientError:
+            status = "error"
+        finally:
+            self.latencies[endpoint].append((time.perf_counter() - start) * 1000)
+            self.statuses[endpoint][status] += 1
+
+    def _next_request(self):
+        if self.product_urls and random.random() < self.detail_ratio:
+            return "/api/product/detail", {"url": random.choice(self.product_urls)}
+        return "/api/search", {
+            "keyword": random.choice(self.keywords),
+            "sort": random.choice(SORTS),
+            "page": random.randint(1, self.max_page),
+            "size": 24,
+        }
+
+    async def _stats(self, session: aiohttp.ClientSession) -> Dict[str, int]:
+        try:
+            async with session.get(f"{self.target}/api/stats", timeout=self.timeout) as response:
+                return (await response.json()).get("requests") or {}
+        except Exception:
+            return {}
+
+    async def run(self, rps: float, duration: float) -> dict:
+        connector = aiohttp.TCPConnector(limit=0)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            before = await self._stats(session)
+
+            # open-loop: 응답 시간과 무관하게 일정 간격으로 요청 발사
+            tasks = []
+            interval = 1.0 / rps
+            start = time.perf_counter()
+            sent = 0
+            while True:
+                elapsed = time.perf_counter() - start
+                if elapsed >= duration:
+                    break
+                due = int(elapsed / interval) + 1
+                while sent < due:
+                    endpoint, payload = self._next_request()
+                    tasks.append(asyncio.create_task(self._request(session, endpoint, payload)))
+                    sent += 1
+                await asyncio.sleep(min(interval, 0.01))
+
+            await asyncio.gather(*tasks)
+            wall = time.perf_counter() - start
+            after = await self._stats(session)
+
+        split = {key: after.get(key, 0) - before.get(key, 0) for key in set(before) | set(after)}
+        return self._report(sent, wall, split)
+
+    def _report(self, sent: int, wall: float, split: Dict[str, int]) -> dict:
+        endpoints = {}
+        for endpoint, values in self.latencies.items():
+            ok = self.statuses[endpoint].get("200", 0)
+            endpoints[endpoint] = {
+                "requests": len(values),
+                "ok": ok,
+                "statuses": dict(self.statuses[endpoint]),
+                "throughput_rps": round(ok / wall, 2),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+            }
+
+        search_total = split.get("search_api", 0) + split.get("search_browser", 0)
+        detail_total = split.get("detail_http", 0) + split.get("detail_browser", 0)
+        return {
+            "sent": sent,
+            "wall_seconds": round(wall, 2),
+            "endpoints": endpoints,
+            "upstream_split": split,
+            "browser_share": {
+                "search": round(split.get("search_browser", 0) / search_total, 3) if search_total else None,
+                "detail": round(split.get("detail_browser", 0) / detail_total, 3) if detail_total else None,
+            },
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 API 부하 생성기")
+    parser.add_argument("--target", default="http://127.0.0.1:8000", help="크롤링 API 주소")
+    parser.add_argument("--rps", type=float, default=10, help="목표 초당 요청 수")
+    parser.add_argument("--duration", type=float, default=30, help="실행 시간(초)")
+    parser.add_argument("--detail-ratio", type=float, default=0.3, help="상세 요청 비율")
+    parser.add_argument("--max-page", type=int, default=3, help="검색 페이지 범위 (1..N)")
+    parser.add_argument("--keywords", help="쉼표로 구분한 검색 키워드")
+    parser.add_argument("--timeout", type=float, default=60, help="요청 타임아웃(초)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    keywords = [k.strip() for k in args.keywords.split(",")] if args.keywords else DEFAULT_KEYWORDS
+    generator = LoadGenerator(args.target, keywords, args.detail_ratio, args.max_page, args.timeout)
+    report = asyncio.run(generator.run(args.rps, args.duration))
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+브라우저 감시/무중단 재시작/종료 대기 테스트 (Chromium 없이 Playwright 객체 대역 사용)
+
+backend 디렉토리에서 실행:
+    python -m pytest tests
+"""
+
+import asyncio
+
+import pytest
+
+from app import scraper as scraper_module
+from app.scraper import BrowserUnavailable, IdusScraper
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+        self.context = FakeContext()
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+        self._handlers = []
+
+    def on(self, event, handler):
+        assert event == "disconnected"
+        self._handlers.append(handler)
+
+    def is_connected(self):
+        return self.connected
+
+    async def close(self):
+        self.closed = True
+        self.crash()
+
+    def crash(self):
+        """Chromium 프로세스 종료 - Playwright처럼 disconnected 이벤트 발생"""
+        if self.connected:
+            self.connected = False
+            for handler in self._handlers:
+                handler(self)
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launched = []
+        self.fail_next = 0
+
+    async def launch(self, **kwargs):
+        if self.fail_next:
+            self.fail_next -= 1
+            raise RuntimeError("launch failed")
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+    async def stop(self):
+        pass
+
+
+@pytest.fixture
+def make_scraper(monkeypatch):
+    monkeypatch.setattr(scraper_module, "create_asset_cache", lambda: None)
+    monkeypatch.setattr(scraper_module, "BROWSER_RELAUNCH_BACKOFF", 0.01)
+
+    async def create_page(self, browser):
+        return FakePage(browser)
+
+    monkeypatch.setattr(IdusScraper, "_create_stealth_page", create_page)
+
+    def make():
+        scraper = IdusScraper()
+        scraper.playwright = FakePlaywright()
+        return scraper
+
+    return make
+
+
+async def wait_until(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+def test_relaunches_after_browser_crash(make_scraper):
+    async def run():
+        scraper = make_scraper()
+        chromium = scraper.playwright.chromium
+        await scraper.initialize()
+        crashed = scraper.browser
+
+        chromium.fail_next = 2
+        crashed.crash()
+        assert scraper.browser is None
+        await wait_until(scraper._browser_ready)
+        assert scraper.browser is not crashed
+        assert len(chromium.launched) == 2
+        assert scraper.get_stats()["browser"]["disconnects"] == 1
+
+        page = await scraper._acquire_page()
+        assert page.browser is scraper.browser
+        await scraper._release_page(page)
+        await scraper.close()
+
+    asyncio.run(run())
+
+
+def test_initialize_relaunches_disconnected_browser(make_scraper):
+    async def run():
+        scraper = make_scraper()
+        await scraper.initialize()
+        stale = scraper.browser
+        # disconnected 이벤트 없이 연결만 끊긴 경우에도 다음 작업에서 다시 실행
+        stale.connected = False
+        await scraper.initialize()
+        assert scraper.browser is not stale and scraper._browser_ready()
+        await scraper.close()
+
+    asyncio.run(run())
+
+
+def test_restart_moves_new_pages_and_waits_for_old(make_scraper):
+    async def run():
+        scraper = make_scraper()
+        await scraper.initialize()
+        old = scraper.browser
+        in_flight = await scraper._acquire_page()
+
+        restart = asyncio.create_task(scraper.restart_browser(timeout=2))
+        await wait_until(lambda: scraper.browser is not old)
+        new_page = await scraper._acquire_page()
+        assert new_page.browser is scraper.browser
+        assert not old.closed
+
+        await scraper._release_page(in_flight)
+        result = await restart
+        assert result["restarted"] and result["abandonedPages"] == 0
+        assert old.closed
+        # 직접 닫은 이전 브라우저는 비정상 종료로 세지 않음
+        assert scraper.browser_disconnects == 0 and scraper._browser_ready()
+
+        await scraper._release_page(new_page)
+        await scraper.close()
+
+    asyncio.run(run())
+
+
+def test_restart_abandons_pages_after_timeout(make_scraper):
+    async def run():
+        scraper = make_scraper()
+        await scraper.initialize()
+        old = scraper.browser
+        stuck = await scraper._acquire_page()
+        result = await scraper.restart_browser(timeout=0.2)
+        assert result["abandonedPages"] == 1
+        assert old.closed
+        await scraper._release_page(stuck)
+        await scraper.close()
+
+    asyncio.run(run())
+
+
+def test_drain_waits_for_in_flight_pages_and_rejects_new_work(make_scraper):
+    async def run():
+        scraper = make_scraper()
+        await scraper.initialize()
+        page = await scraper._acquire_page()
+
+        drain = asyncio.create_task(scraper.drain(timeout=2))
+        await asyncio.sleep(0.05)
+        assert not drain.done()
+        with pytest.raises(BrowserUnavailable):
+            await scraper._acquire_page()
+
+        await scraper._release_page(page)
+        assert await drain == 0
+
+        chromium = scraper.playwright.chromium
+        browser = scraper.browser
+        await scraper.close()
+        assert browser.closed
+        # 종료 중 disconnected 이벤트로 다시 실행하지 않음
+        await asyncio.sleep(0.05)
+        assert len(chromium.launched) == 1 and scraper.browser is None
+
+    asyncio.run(run())
+
+
+def test_drain_returns_remaining_pages_on_timeout(make_scraper):
+    async def run():
+        scraper = make_scraper()
+        await scraper.initialize()
+        page = await scraper._acquire_page()
+        assert await scraper.drain(timeout=0.2) == 1
+        await scraper._release_page(page)
+        await scraper.close()
+
+    asyncio.run(run())
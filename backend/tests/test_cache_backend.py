@@ -0,0 +1,235 @@
+"""
+SharedCache single-flight / 락 인계 테스트
+
+backend 디렉토리에서 실행:
+    python -m pytest tests
+
+redis 백엔드는 fakeredis(+lupa, 락 해제 Lua 스크립트)로 실행하고,
+TEST_REDIS_URL이 있으면 해당 redis-server를 사용
+"""
+
+import asyncio
+import os
+import uuid
+
+import pytest
+
+from app import cache_backend
+from app.cache_backend import MemoryBackend, RedisBackend, SharedCache
+
+TEST_REDIS_URL = os.environ.get("TEST_REDIS_URL")
+
+
+def _redis_factory():
+    """같은 Redis를 보는 레플리카별 백엔드 생성 함수"""
+    prefix = f"test:{uuid.uuid4().hex[:8]}:"
+    if TEST_REDIS_URL:
+        return lambda: RedisBackend(TEST_REDIS_URL, prefix=prefix)
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    server = fakeredis.FakeServer()
+    return lambda: RedisBackend("", prefix=prefix, client=fakeredis.aioredis.FakeRedis(server=server))
+
+
+@pytest.fixture(params=["memory", "redis"])
+def replicas(request, monkeypatch):
+    """replicas(n) -> 같은 백엔드를 공유하는 SharedCache n개 (레플리카 역할)"""
+    monkeypatch.setattr(cache_backend, "SINGLE_FLIGHT_POLL", 0.01)
+    if request.param == "memory":
+        shared = MemoryBackend(100)
+        make_backend = lambda: shared
+    else:
+        make_backend = _redis_factory()
+    return lambda n: [SharedCache(make_backend(), ttl=60) for _ in range(n)]
+
+
+class CountingFetch:
+    def __init__(self, value="fresh", delay=0.05, error=None):
+        self.value = value
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.value
+
+
+def test_coalesces_concurrent_requests_in_process(replicas):
+    async def run():
+        (cache,) = replicas(1)
+        fetch = CountingFetch()
+        results = await asyncio.gather(*[cache.get_or_fetch("k", fetch) for _ in range(10)])
+        assert fetch.calls == 1
+        assert {value for value, _ in results} == {"fresh"}
+        assert cache.coalesced == 9
+        assert await cache.get_or_fetch("k", fetch) == ("fresh", True)
+
+    asyncio.run(run())
+
+
+def test_single_flight_across_replicas(replicas):
+    async def run():
+        first, second = replicas(2)
+        fetch = CountingFetch(delay=0.1)
+        (value_a, hit_a), (value_b, hit_b) = await asyncio.gather(
+            first.get_or_fetch("k", fetch), second.get_or_fetch("k", fetch)
+        )
+        assert fetch.calls == 1
+        assert value_a == value_b == "fresh"
+        assert sorted([hit_a, hit_b]) == [False, True]
+        assert first.remote_waits + second.remote_waits == 1
+        # 끝난 뒤 락이 남아 있지 않음
+        assert not await first.backend.is_locked("lock:k")
+
+    asyncio.run(run())
+
+
+def test_refresh_waits_for_lock_holder(replicas):
+    async def run():
+        first, second = replicas(2)
+        await first.set("k", "stale")
+        holder = CountingFetch(value="refreshed", delay=0.1)
+        waiter = CountingFetch(value="duplicate")
+
+        holder_task = asyncio.create_task(first.get_or_fetch("k", holder, refresh=True))
+        await asyncio.sleep(0.02)
+        value, hit = await second.get_or_fetch("k", waiter, refresh=True)
+        assert value == "refreshed"
+        assert hit
+        assert waiter.calls == 0
+        assert await holder_task == ("refreshed", False)
+
+    asyncio.run(run())
+
+
+def test_failed_holder_hands_off_lock(replicas):
+    async def run():
+        first, second = replicas(2)
+        holder = CountingFetch(delay=0.05, error=RuntimeError("upstream down"))
+        waiter = CountingFetch(value="from-waiter")
+
+        holder_task = asyncio.create_task(first.get_or_fetch("k", holder))
+        await asyncio.sleep(0.01)
+        started = asyncio.get_running_loop().time()
+        assert await second.get_or_fetch("k", waiter) == ("from-waiter", False)
+        # SINGLE_FLIGHT_WAIT까지 기다리지 않고 락을 넘겨받음
+        assert asyncio.get_running_loop().time() - started < 1
+        assert waiter.calls == 1
+        with pytest.raises(RuntimeError):
+            await holder_task
+        assert not await second.backend.is_locked("lock:k")
+
+    asyncio.run(run())
+
+
+def test_lock_release_requires_owner_token(replicas):
+    async def run():
+        (cache,) = replicas(1)
+        token = await cache.backend.acquire_lock("lock:k", 30)
+        assert token
+        assert await cache.backend.acquire_lock("lock:k", 30) is None
+        await cache.backend.release_lock("lock:k", "not-the-owner")
+        assert await cache.backend.is_locked("lock:k")
+        await cache.backend.release_lock("lock:k", token)
+        assert not await cache.backend.is_locked("lock:k")
+
+    asyncio.run(run())
+
+
+def test_user_request_refetches_when_joined_background_fetch_fails(replicas):
+    async def run():
+        (cache,) = replicas(1)
+        background = CountingFetch(delay=0.05, error=RuntimeError("API only, no browser fallback"))
+        user = CountingFetch(value="from-browser")
+
+        background_task = asyncio.create_task(cache.get_or_fetch("k", background, background=True))
+        await asyncio.sleep(0.01)
+        assert await cache.get_or_fetch("k", user) == ("from-browser", False)
+        assert background.calls == 1 and user.calls == 1
+        with pytest.raises(RuntimeError):
+            await background_task
+        assert await cache.get("k") == "from-browser"
+
+    asyncio.run(run())
+
+
+def test_user_request_refetches_when_joined_background_fetch_is_cancelled(replicas):
+    async def run():
+        (cache,) = replicas(1)
+        background = CountingFetch(delay=1)
+        user = CountingFetch(value="from-user")
+
+        background_task = asyncio.create_task(cache.get_or_fetch("k", background, background=True))
+        await asyncio.sleep(0.01)
+        user_task = asyncio.create_task(cache.get_or_fetch("k", user))
+        await asyncio.sleep(0.01)
+        background_task.cancel()
+        assert await user_task == ("from-user", False)
+
+    asyncio.run(run())
+
+
+def test_background_and_user_failures_propagate_to_joined_callers(replicas):
+    async def run():
+        (cache,) = replicas(1)
+        # 사용자 fetch 실패는 합류한 요청에도 그대로 전달 (같은 경로를 다시 시도하지 않음)
+        failing_user = CountingFetch(delay=0.05, error=RuntimeError("down"))
+        owner = asyncio.create_task(cache.get_or_fetch("a", failing_user))
+        await asyncio.sleep(0.01)
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("a", CountingFetch())
+        with pytest.raises(RuntimeError):
+            await owner
+
+        # 백그라운드 요청끼리는 실패를 공유
+        failing_background = CountingFetch(delay=0.05, error=RuntimeError("down"))
+        owner = asyncio.create_task(cache.get_or_fetch("b", failing_background, background=True))
+        await asyncio.sleep(0.01)
+        other = CountingFetch()
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("b", other, background=True)
+        assert other.calls == 0
+        with pytest.raises(RuntimeError):
+            await owner
+
+    asyncio.run(run())
+
+
+def test_user_search_refetches_when_joined_warmer_refresh_fails(replicas):
+    async def run():
+        (cache,) = replicas(1)
+        # 캐시가 만료된 키를 워머가 갱신 중 (API만 사용) - 사용자 검색이 합류
+        warmer = CountingFetch(delay=0.05, error=RuntimeError("API failed"))
+        user = CountingFetch(value="browser-result")
+
+        warm_task = asyncio.create_task(cache.get_or_fetch("search:k", warmer, refresh=True, background=True))
+        await asyncio.sleep(0.01)
+        assert await cache.get_or_fetch("search:k", user) == ("browser-result", False)
+        with pytest.raises(RuntimeError):
+            await warm_task
+
+    asyncio.run(run())
+
+
+def test_uncacheable_result_is_returned_but_not_stored(replicas):
+    async def run():
+        a, b = replicas(2)
+        placeholder = CountingFetch(value={"title": "placeholder"})
+        cacheable = lambda value: value["title"] != "placeholder"
+
+        value, hit = await a.get_or_fetch("detail:1", placeholder, cacheable=cacheable)
+        assert (value, hit) == ({"title": "placeholder"}, False)
+        assert await b.get("detail:1") is None
+        assert a.uncached == 1
+
+        # 다음 요청(다른 레플리카 포함)은 다시 가져오고, 정상 결과는 저장
+        fresh = CountingFetch(value={"title": "상품"})
+        assert await b.get_or_fetch("detail:1", fresh, cacheable=cacheable) == ({"title": "상품"}, False)
+        assert await a.get_or_fetch("detail:1", fresh, cacheable=cacheable) == ({"title": "상품"}, True)
+        assert fresh.calls == 1
+
+    asyncio.run(run())
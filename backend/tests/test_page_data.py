@@ -0,0 +1,123 @@
+"""
+read_detail_payload / ScriptDataParser 테스트
+
+benchmarks/fixtures/detail.html (JSON-LD → __NEXT_DATA__ 순서)과 그 변형을
+청크 단위로 나눠 주는 가짜 응답으로 파싱
+"""
+
+import asyncio
+import json
+import os
+import re
+
+import pytest
+
+from app.page_data import read_detail_payload
+
+FIXTURE = os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "fixtures", "detail.html")
+# 스크립트 뒤에 오는 본문 (조기 종료 시 읽지 않아야 함)
+TAIL = "<div>" + "리뷰 " * 50000 + "</div></body></html>"
+
+_LD_RE = re.compile(r'<script type="application/ld\+json">.*?</script>', re.S)
+_NEXT_RE = re.compile(r'<script id="__NEXT_DATA__" type="application/json">.*?</script>', re.S)
+
+
+def _fixture() -> str:
+    with open(FIXTURE, encoding="utf-8") as f:
+        return f.read()
+
+
+def _scripts(html: str):
+    return _LD_RE.search(html).group(), _NEXT_RE.search(html).group()
+
+
+def _page(*scripts: str) -> str:
+    return "<html><head><title>상품</title>" + "".join(scripts) + "</head><body>" + TAIL
+
+
+class FakeContent:
+    def __init__(self, body: bytes, response):
+        self.body = body
+        self.response = response
+
+    async def iter_chunked(self, size: int):
+        for start in range(0, len(self.body), size):
+            if self.response.closed:
+                return
+            self.response.bytes_read = start + size
+            yield self.body[start:start + size]
+
+
+class FakeResponse:
+    charset = "utf-8"
+
+    def __init__(self, html: str):
+        self.body = html.encode("utf-8")
+        self.content = FakeContent(self.body, self)
+        self.bytes_read = 0
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _read(html: str, chunk_size: int = 16384):
+    response = FakeResponse(html)
+    return asyncio.run(read_detail_payload(response, chunk_size)), response
+
+
+def test_stops_reading_after_next_data_with_product():
+    ld, next_data = _scripts(_fixture())
+    product, response = _read(_page(ld, next_data))
+
+    assert product["uuid"] == "4242aadb-c8f4-29a4-79c8-c2926b94b5b5"
+    assert response.closed
+    assert response.bytes_read < len(response.body) // 2
+
+
+@pytest.mark.parametrize("order", ["ld-first", "next-first"])
+def test_next_data_wins_over_json_ld(order):
+    ld, next_data = _scripts(_fixture())
+    scripts = (ld, next_data) if order == "ld-first" else (next_data, ld)
+    product, response = _read(_page(*scripts))
+
+    assert product["uuid"] == "4242aadb-c8f4-29a4-79c8-c2926b94b5b5"
+    assert "@type" not in product
+    assert response.closed
+
+
+@pytest.mark.parametrize("order", ["ld-first", "next-first"])
+def test_next_data_without_product_falls_through_to_json_ld(order):
+    ld, _ = _scripts(_fixture())
+    empty_next = '<script id="__NEXT_DATA__" type="application/json">%s</script>' % json.dumps(
+        {"props": {"pageProps": {"initialData": {}}}}
+    )
+    scripts = (ld, empty_next) if order == "ld-first" else (empty_next, ld)
+    product, response = _read(_page(*scripts))
+
+    assert product["@type"] == "Product"
+    assert product["name"] == "자개 반지 캔들 00"
+    # 두 스크립트를 모두 확보하면 나머지 본문은 읽지 않음
+    assert response.closed
+
+
+def test_no_product_scripts_reads_whole_body():
+    product, response = _read(_page('<script src="/main.js"></script>'))
+
+    assert product is None
+    assert not response.closed
+    assert response.bytes_read >= len(response.body)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_scripts_split_across_chunk_boundaries(chunk_size):
+    # 작은 청크는 스크립트 태그/본문과 한글 UTF-8 바이트 중간을 자름
+    html = _fixture()
+    ld, _ = _scripts(html)
+    full, _ = _read(html)
+    split, _ = _read(html, chunk_size)
+    assert split == full
+    assert split["name"] == "자개 반지 캔들 00"
+
+    fallback, _ = _read(_page(ld), chunk_size)
+    assert fallback["@type"] == "Product"
@@ -2,7 +2,7 @@ import React from 'react';
 import { motion } from 'framer-motion';
 import { Check, Plus, Star, ExternalLink } from 'lucide-react';
 import type { IdusProduct } from '../types';
-import { formatPrice } from '../services/idusService';
+import { formatPrice, proxyImageUrl, CARD_IMAGE_WIDTH } from '../services/idusService';
 import { useCampaignStore } from '../store/campaignStore';
 import { MAX_SELECTED_PRODUCTS } from '../constants';
 
@@ -52,7 +52,7 @@ export const ProductCard: React.FC<ProductCardProps> = ({ product, onQuickView }
       {/* 이미지 영역 */}
       <div className="relative aspect-square overflow-hidden bg-gray-100">
         <img
-          src={product.image}
+          src={proxyImageUrl(product.image, CARD_IMAGE_WIDTH)}
           alt={product.title}
           className="w-full h-full object-cover transition-transform duration-500 group-hover:scale-105"
           loading="lazy"
@@ -15,7 +15,13 @@ import {
 import { ProductCard, ProductCardSkeleton } from './ProductCard';
 import { ProductQuickView } from './ProductQuickView';
 import { useCampaignStore } from '../store/campaignStore';
-import { searchProductsWithPagination, formatPrice, ITEMS_PER_PAGE } from '../services/idusService';
+import {
+  searchProductsWithPagination,
+  formatPrice,
+  proxyImageUrl,
+  ITEMS_PER_PAGE,
+  THUMB_IMAGE_WIDTH,
+} from '../services/idusService';
 import { useInfiniteScroll } from '../hooks/useInfiniteScroll';
 import { SORT_OPTIONS, MAX_SELECTED_PRODUCTS } from '../constants';
 import type { IdusProduct } from '../types';
@@ -421,7 +427,7 @@ export const ProductDiscovery: React.FC<ProductDiscoveryProps> = ({ onNavigateTo
                         className="flex items-center gap-2 bg-gray-100 rounded-lg px-3 py-1.5 flex-shrink-0"
                       >
                         <img
-                          src={product.image}
+                          src={proxyImageUrl(product.image, THUMB_IMAGE_WIDTH)}
                           alt={product.title}
                           className="w-8 h-8 rounded object-cover"
                         />
@@ -3,6 +3,11 @@ import type { IdusProduct, ProductSearchParams } from '../types';
 // 페이지당 아이템 수
 export const ITEMS_PER_PAGE = 24;
 
+// 화면 표시용 이미지 폭 (백엔드 이미지 프록시가 이 폭에 맞는 변형을 선택)
+// 결과 그리드 카드 / 선택된 작품 목록 썸네일 (2x 화면 기준)
+export const CARD_IMAGE_WIDTH = 400;
+export const THUMB_IMAGE_WIDTH = 64;
+
 // Railway 백엔드 API URL (환경변수에서 가져옴)
 const CRAWLER_API_URL = import.meta.env.VITE_CRAWLER_API_URL || '';
 
@@ -114,7 +119,7 @@ async function searchViaRailwayApi(
   // 상품 데이터 정규화 (이미지 URL 검증 및 수정)
   const products = (data.products || []).map((p: IdusProduct) => ({
     ...p,
-    // 이미지 URL이 없거나 잘못된 경우 대체 이미지 사용
+    // 이미지 URL이 없거나 잘못된 경우 대체 이미지 사용 (원본 idus URL 유지 - 표시 크기 변형은 컴포넌트에서 proxyImageUrl로)
     image: normalizeImageUrl(p.image),
     // 숫자 필드 안전하게 처리
     price: typeof p.price === 'number' ? p.price : parseInt(String(p.price)) || 0,
@@ -167,6 +172,17 @@ function normalizeImageUrl(url: string | undefined | null): string {
   return url;
 }
 
+/**
+ * Railway 백엔드 이미지 프록시 URL (idus 사이즈 변형 선택 + 디스크 캐시)
+ * <img src> 표시용 - 상품 데이터(image)에는 원본 idus URL을 저장
+ */
+export function proxyImageUrl(url: string, width: number): string {
+  if (!url || !CRAWLER_API_URL || !/^https:\/\/(image|www)\.idus\.com\//.test(url)) {
+    return url;
+  }
+  return `${CRAWLER_API_URL}/api/image?url=${encodeURIComponent(url)}&w=${width}`;
+}
+
 /**
  * Vercel Serverless API를 통한 검색 (fallback)
  */